@@ -1,5 +1,32 @@
+import logging
+from typing import Any, Optional
+
+import jwt
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _decode_claims(token: Optional[str]) -> dict[str, Any]:
+    """Decode the claims of a JWT without verifying it, returning no claims if it is not a JWT."""
+    if token is None:
+        return {}
+    try:
+        return jwt.decode(
+            token,
+            options={"verify_signature": False, "verify_exp": False},
+        )
+    except jwt.PyJWTError as e:
+        _LOGGER.debug("Unable to decode access token - %s", e)
+        return {}
+
+
 class AuthData:
     def __init__(self, access_token: str, refresh_token: str, api_key: str):
         self.access_token = access_token
         self.refresh_token = refresh_token
         self.api_key = api_key
+
+        # Claims are decoded once per token, validity checks only compare timestamps
+        claims = _decode_claims(access_token)
+        self.exp: Optional[float] = claims.get("exp")
+        self.sub: Optional[str] = claims.get("sub")
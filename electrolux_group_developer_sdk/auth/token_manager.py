@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import random
 import time
 from typing import Callable, Optional
 
@@ -9,11 +11,18 @@ from .invalid_token_exception import InvalidTokenException
 from .token_refresh_failed import TokenRefreshFailedException
 from .auth_data import AuthData
 from ..client.client_util import request
+from ..client.session_manager import SessionManager
 from ..config import TOKEN_REVOKE_URL, TOKEN_REFRESH_URL, USER_EMAIL_URL
 from ..constants import GET, REFRESH_TOKEN, POST
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_BACKGROUND_REFRESH_MARGIN = 300  # seconds before expiry
+DEFAULT_BACKGROUND_REFRESH_JITTER = 60
+BACKGROUND_REFRESH_INITIAL_BACKOFF = 5
+BACKGROUND_REFRESH_MAX_BACKOFF = 300
+MIN_BACKGROUND_REFRESH_INTERVAL = 10
+
 
 def get_user_id_from_token(token: str) -> str:
     """Extract user id from token"""
@@ -28,12 +37,21 @@ def get_user_id_from_token(token: str) -> str:
 
 
 class TokenManager:
-    def __init__(self, access_token: str, refresh_token: str, api_key: str, on_token_update: Optional[Callable[[str, str, str], None]] = None):
-        """Initialize the token manager."""
+    def __init__(self, access_token: str, refresh_token: str, api_key: str, on_token_update: Optional[Callable[[str, str, str], None]] = None,
+                 session_manager: Optional[SessionManager] = None):
+        """Initialize the token manager.
+
+        A SessionManager can be injected to share pooled connections with other clients. When not
+        provided, the token manager owns its own and closes it in close().
+        """
         if access_token is None:
             _LOGGER.error("Access Token is missing")
             raise InvalidCredentialsException()
         self._on_token_update = on_token_update
+        self._owns_session_manager = session_manager is None
+        self._session_manager = session_manager if session_manager is not None else SessionManager()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._background_refresh_task: Optional[asyncio.Task] = None
         self._auth_data = AuthData(access_token, refresh_token, api_key)
         self.update(access_token, refresh_token, api_key)
 
@@ -57,27 +75,39 @@ class TokenManager:
 
     def get_user_id(self) -> str:
         """Extract user id from stored token"""
-        return get_user_id_from_token(self._auth_data.access_token)
+        user_id = self._auth_data.sub
+        if user_id is None:
+            raise InvalidTokenException()
+        return user_id
+
+    def _get_token_expiry(self) -> Optional[float]:
+        """Return the expiry timestamp of the stored access token, if known."""
+        if not self._auth_data:
+            return None
+        return self._auth_data.exp
 
     def is_token_valid(self) -> bool:
         """Check token validity"""
-        try:
-            payload = jwt.decode(
-                self._auth_data.access_token,
-                options={"verify_signature": False, "verify_exp": False},
-            )
-            exp = payload.get("exp")
-            if exp is None:
-                return False
-
-            current_time = time.time()
-            return (exp - current_time) > 60
-
-        except jwt.ExpiredSignatureError as e:
-            _LOGGER.error("Access Token is invalid - %s", e)
+        exp = self._get_token_expiry()
+        if exp is None:
             return False
 
+        return (exp - time.time()) > 60
+
     async def refresh_token(self) -> bool:
+        """Refresh the tokens, sharing a single in-flight refresh between concurrent callers."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.ensure_future(self._refresh_token())
+            self._refresh_task.add_done_callback(self._clear_refresh_task)
+
+        # Shield the shared refresh so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._refresh_task)
+
+    def _clear_refresh_task(self, task: asyncio.Task) -> None:
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def _refresh_token(self) -> bool:
         auth_data = self._auth_data
 
         if not auth_data or auth_data.refresh_token is None:
@@ -87,7 +117,9 @@ class TokenManager:
         payload = {REFRESH_TOKEN: auth_data.refresh_token}
 
         try:
-            data = await request(method=POST, url=TOKEN_REFRESH_URL, json_body=payload)
+            data = await request(
+                method=POST, url=TOKEN_REFRESH_URL, json_body=payload, session_manager=self._session_manager
+            )
 
             self.update(
                 access_token=data["accessToken"],
@@ -108,7 +140,9 @@ class TokenManager:
         payload = {REFRESH_TOKEN: auth_data.refresh_token}
 
         try:
-            await request(method=POST, url=TOKEN_REVOKE_URL, json_body=payload)
+            await request(
+                method=POST, url=TOKEN_REVOKE_URL, json_body=payload, session_manager=self._session_manager
+            )
 
             self._auth_data = None
 
@@ -130,3 +164,95 @@ class TokenManager:
             auth_data = self._auth_data
 
         return auth_data
+
+    def start_background_refresh(
+            self,
+            refresh_margin: float = DEFAULT_BACKGROUND_REFRESH_MARGIN,
+            jitter: float = DEFAULT_BACKGROUND_REFRESH_JITTER,
+    ) -> None:
+        """
+        Start a background task that refreshes the tokens ahead of expiry.
+
+        The refresh is scheduled `refresh_margin` seconds, minus a random jitter of up to `jitter`
+        seconds, before the access token expires, so calls on the request path do not have to wait
+        for a refresh. Failed refreshes are retried with an exponential backoff. on_token_update is
+        called for every refresh.
+
+        Args:
+            refresh_margin: Seconds before expiry at which the refresh is scheduled. Should be larger
+                than the 60 seconds after which get_auth_data refreshes on the request path.
+            jitter: Max random seconds added to the margin, to spread refreshes of many clients.
+        """
+        if self._background_refresh_task is not None and not self._background_refresh_task.done():
+            return
+
+        self._background_refresh_task = asyncio.create_task(
+            self._background_refresh_loop(refresh_margin, jitter)
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Stop the background refresh task if it is running."""
+        task = self._background_refresh_task
+        self._background_refresh_task = None
+        if task is None or task.done():
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _background_refresh_loop(self, refresh_margin: float, jitter: float) -> None:
+        while True:
+            expiry = self._get_token_expiry()
+            if expiry is None:
+                if not self._auth_data:
+                    _LOGGER.info("Tokens revoked, stopping background refresh")
+                    return
+                # Unknown expiry, the request path refreshes it, look again later
+                await asyncio.sleep(refresh_margin)
+                continue
+
+            delay = expiry - refresh_margin - random.uniform(0, jitter) - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self._get_token_expiry() != expiry:
+                # Already refreshed on the request path or updated by the caller
+                continue
+
+            if not await self._refresh_with_backoff():
+                return
+
+            # Avoid refreshing in a loop when the token lifetime is shorter than the margin
+            await asyncio.sleep(MIN_BACKGROUND_REFRESH_INTERVAL)
+
+    async def _refresh_with_backoff(self) -> bool:
+        """Refresh the tokens until it succeeds, returning False if the credentials are unusable."""
+        attempt = 0
+        while True:
+            try:
+                if await self.refresh_token():
+                    _LOGGER.debug("Tokens refreshed in background")
+                    return True
+            except InvalidCredentialsException as e:
+                _LOGGER.error("Stopping background refresh - %s", e)
+                return False
+
+            attempt += 1
+            backoff = min(BACKGROUND_REFRESH_INITIAL_BACKOFF * 2 ** (attempt - 1), BACKGROUND_REFRESH_MAX_BACKOFF)
+            _LOGGER.warning("Background token refresh failed, retrying in %s seconds", backoff)
+            await asyncio.sleep(backoff + random.uniform(0, backoff * 0.3))
+
+    async def close(self) -> None:
+        """Stop the background refresh and close the HTTP session if it is owned by this token manager."""
+        await self.stop_background_refresh()
+        if self._owns_session_manager:
+            await self._session_manager.close()
+
+    async def __aenter__(self) -> "TokenManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -119,6 +119,8 @@ async def main():
                 print(f"Error starting SSE: {e}")
         elif choice == "12":
             print("Exiting.")
+            await appliance_client.close()
+            await token_manager.close()
             break
         else:
             print("Invalid option. Try again.")
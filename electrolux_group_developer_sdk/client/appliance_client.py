@@ -1,19 +1,24 @@
 import asyncio
 import json
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 
 import aiohttp
 from aiohttp import ClientTimeout, ClientResponseError
-from aiohttp.hdrs import USER_AGENT, AUTHORIZATION
+from aiohttp.hdrs import USER_AGENT, AUTHORIZATION, ETAG, IF_NONE_MATCH, LAST_EVENT_ID
+from multidict import CIMultiDict
 
 from electrolux_group_developer_sdk.auth.token_refresh_failed import TokenRefreshFailedException
 from electrolux_group_developer_sdk.client.bad_credentials_exception import BadCredentialsException
 
 from .appliance_data_factory import appliance_data_factory
+from .appliance_state_store import ApplianceStateStore
 from .client_exception import ApplianceClientException
 from .client_util import request
+from .details_cache import DetailsCache
 from .dto.appliance import Appliance
 from .dto.appliance_details import ApplianceDetails
 from .dto.appliance_state import ApplianceState
@@ -21,7 +26,14 @@ from .dto.email import Email
 from .dto.interactive_map import InteractiveMap
 from .dto.livestream_config import LivestreamConfig
 from .dto.memory_map import MemoryMap
+from .event_coalescer import EventCoalescer
+from .event_dispatcher import EventDispatcher, Listener
 from .failed_connection_exception import FailedConnectionException
+from .reconnect_policy import ReconnectPolicy
+from .session_manager import SessionManager
+from .sse_update import apply_sse_update, apply_sse_updates, diff_sse_update
+from .sse_parser import SseEvent, SseParser
+from ..auth.auth_data import AuthData
 from ..auth.invalid_credentials_exception import InvalidCredentialsException
 from ..auth.token_manager import TokenManager
 from ..client.appliances.appliance_data import ApplianceData
@@ -39,6 +51,10 @@ from ..constants import API_KEY, GET, PUT, SDK_USER_AGENT, SDK_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 5  # appliances fetched at the same time in concurrent mode
+SSE_CHUNK_SIZE = 64 * 1024
+SSE_READ_TIMEOUT = 120  # seconds without data before the livestream is considered dead
+
 def _is_dam_appliance(appliance_id):
     if appliance_id.startswith("1:"):
         return True
@@ -57,6 +73,12 @@ def _build_user_agent(external_user_agent: Optional[str] = None) -> str:
     return sdk_user_agent
 
 
+def _create_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return asyncio.Semaphore(max_concurrency)
+
+
 class ApplianceClient:
     """
     Client for interacting with the Electrolux Developer API to manage and retrieve appliance data.
@@ -66,9 +88,20 @@ class ApplianceClient:
 
     Attributes:
         _token_manager (TokenManager)
+        _session_manager (SessionManager)
     """
 
-    def __init__(self, token_manager: TokenManager, external_user_agent: Optional[str] = None):
+    def __init__(
+            self,
+            token_manager: TokenManager,
+            external_user_agent: Optional[str] = None,
+            session_manager: Optional[SessionManager] = None,
+            reconnect_policy: Optional[ReconnectPolicy] = None,
+            event_dispatcher: Optional[EventDispatcher] = None,
+            event_coalescer: Optional[EventCoalescer] = None,
+            diff_events: bool = False,
+            details_cache: Optional[DetailsCache] = None,
+    ):
         """
         Initialize the ApplianceClient.
 
@@ -78,10 +111,75 @@ class ApplianceClient:
                 to the SDK's default User-Agent header when making the request. This allows
                 external applications to identify themselves in API calls. If not provided,
                 only the SDK's default user agent is used.
+            session_manager (SessionManager, optional): Pooled HTTP session to reuse for every
+                request. It can be shared with the TokenManager. When not provided, the client
+                owns its own and closes it in close().
+            reconnect_policy (ReconnectPolicy, optional): Delays between livestream reconnects.
+                Defaults to an immediate first retry followed by a jittered exponential backoff.
+            event_dispatcher (EventDispatcher, optional): Delivers livestream events to listeners
+                from per-appliance queues instead of inside the read loop, and allows coroutine
+                listeners. When not provided, listeners are called synchronously.
+            event_coalescer (EventCoalescer, optional): Merges the property updates of an appliance
+                into batched `{"applianceId": ..., "delta": {property: value}}` events before they
+                reach the listeners. When not provided, listeners receive every update.
+            diff_events (bool): Compare livestream updates with the state store and only deliver
+                the ones that change the state, with the previous value under "oldValue". Updates
+                of appliances without a known state are always delivered.
+            details_cache (DetailsCache, optional): Serves appliance details from a cache and
+                revalidates expired entries with If-None-Match when the server sent an ETag.
         """
         self._token_manager = token_manager
-        self._sse_listeners: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
+        self._sse_listeners: dict[str, list[Listener]] = {}
         self._external_user_agent = external_user_agent
+        self._user_agent = _build_user_agent(external_user_agent)
+        self._headers_auth_data: Optional[AuthData] = None
+        self._headers: Mapping[str, str] = MappingProxyType({})
+        self._owns_session_manager = session_manager is None
+        self._session_manager = session_manager if session_manager is not None else SessionManager()
+        self._reconnect_policy = reconnect_policy if reconnect_policy is not None else ReconnectPolicy()
+        self._last_event_id: Optional[str] = None
+        self._event_dispatcher = event_dispatcher
+        self._event_coalescer = event_coalescer
+        self._state_store = ApplianceStateStore()
+        self._diff_events = diff_events
+        self._details_cache = details_cache
+        self._livestream_gap_possible = True
+
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy:
+        """Livestream reconnect policy, exposing the reconnect counters."""
+        return self._reconnect_policy
+
+    @property
+    def state_store(self) -> ApplianceStateStore:
+        """Latest state of every appliance, seeded by get_appliance_state and updated by the livestream."""
+        return self._state_store
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """ID of the last livestream event received, sent as Last-Event-ID when reconnecting."""
+        return self._last_event_id
+
+    @property
+    def livestream_gap_possible(self) -> bool:
+        """
+        Return True if events may have been missed when the livestream was last (re)connected.
+
+        This is the case on the first connection and on reconnects that could not be resumed because
+        no event ID was received yet. Catch-up polling of the appliance state is only needed then.
+        """
+        return self._livestream_gap_possible
+
+    async def close(self) -> None:
+        """Close the HTTP session if it is owned by this client."""
+        if self._owns_session_manager:
+            await self._session_manager.close()
+
+    async def __aenter__(self) -> "ApplianceClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
 
     async def test_connection(self) -> None:
         try:
@@ -111,37 +209,93 @@ class ApplianceClient:
             _LOGGER.error("Error during get user email: %s", e)
             raise ApplianceClientException(f"Failed to get user email: {e}")
 
-    async def get_appliance_data(self) -> list[ApplianceData]:
-        """Retrieve all the appliances data, returning specific appliance types when available."""
+    async def get_appliance_data(
+            self, concurrent: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApplianceData]:
+        """
+        Retrieve all the appliances data, returning specific appliance types when available.
+
+        Args:
+            concurrent (bool): Fetch details and state of all appliances in parallel instead of one
+                after another. Requests are still bounded by the shared rate limiter and semaphore.
+            max_concurrency (int): Max number of appliances fetched at the same time in concurrent mode.
+
+        Returns:
+            list[ApplianceData]: The appliances data, in the order returned by get_appliances.
+        """
+        semaphore = _create_semaphore(max_concurrency) if concurrent else None
         appliances = await self.get_appliances()
 
-        appliance_list = []
-        for appliance in appliances:
-            try:
-                details = await self.get_appliance_details(appliance.applianceId)
-            except ApplianceClientException as e:
-                details = None
-                _LOGGER.warning(
-                    "Failed to get details for %s: %s", appliance.applianceId, e
-                )
+        if semaphore is None:
+            return [await self._fetch_appliance_data(appliance) for appliance in appliances]
 
-            try:
-                state = await self.get_appliance_state(appliance.applianceId)
-            except ApplianceClientException as e:
-                state = None
-                _LOGGER.warning(
-                    "Failed to get state for %s: %s", appliance.applianceId, e
+        return list(await asyncio.gather(
+            *(self._fetch_appliance_data(appliance, semaphore) for appliance in appliances)
+        ))
+
+    async def iter_appliance_data(
+            self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> AsyncIterator[ApplianceData]:
+        """
+        Fetch all the appliances data concurrently and yield each one as soon as it is available.
+
+        Appliances are yielded in completion order, so the first ones can be used before the
+        slowest one arrives.
+
+        Args:
+            max_concurrency (int): Max number of appliances fetched at the same time.
+        """
+        semaphore = _create_semaphore(max_concurrency)
+        appliances = await self.get_appliances()
+
+        tasks = [
+            asyncio.create_task(self._fetch_appliance_data(appliance, semaphore))
+            for appliance in appliances
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_appliance_data(
+            self, appliance: Appliance, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> ApplianceData:
+        """Fetch details and state of an appliance, tolerating failures of either call."""
+        if semaphore is None:
+            details = await self._get_appliance_details_or_none(appliance.applianceId)
+            state = await self._get_appliance_state_or_none(appliance.applianceId)
+        else:
+            async with semaphore:
+                details, state = await asyncio.gather(
+                    self._get_appliance_details_or_none(appliance.applianceId),
+                    self._get_appliance_state_or_none(appliance.applianceId),
                 )
 
-            appliance_data = appliance_data_factory(
-                appliance=appliance,
-                details=details,
-                state=state,
-            )
+        return appliance_data_factory(
+            appliance=appliance,
+            details=details,
+            state=state,
+        )
 
-            appliance_list.append(appliance_data)
+    async def _get_appliance_details_or_none(self, appliance_id: str) -> Optional[ApplianceDetails]:
+        try:
+            return await self.get_appliance_details(appliance_id)
+        except ApplianceClientException as e:
+            _LOGGER.warning(
+                "Failed to get details for %s: %s", appliance_id, e
+            )
+            return None
 
-        return appliance_list
+    async def _get_appliance_state_or_none(self, appliance_id: str) -> Optional[ApplianceState]:
+        try:
+            return await self.get_appliance_state(appliance_id)
+        except ApplianceClientException as e:
+            _LOGGER.warning(
+                "Failed to get state for %s: %s", appliance_id, e
+            )
+            return None
 
     async def get_appliances(self) -> list[Appliance]:
         """
@@ -185,9 +339,31 @@ class ApplianceClient:
 
         url = GET_APPLIANCE_INFO_URL.format(appliance_id=appliance_id)
 
+        cached = None
+        extra_headers = None
+        if self._details_cache is not None:
+            cached = self._details_cache.get_entry(appliance_id)
+            if cached is not None:
+                if self._details_cache.is_fresh(cached):
+                    return cached.details
+                if cached.etag:
+                    extra_headers = {IF_NONE_MATCH: cached.etag}
+
         try:
-            response = await self._send_authorized_request(GET, url)
-            return ApplianceDetails(**response)
+            response_headers = CIMultiDict()
+            response = await self._send_authorized_request(
+                GET, url, extra_headers=extra_headers, response_headers=response_headers
+            )
+
+            if response is None and extra_headers is not None:
+                # 304 Not Modified: the cached details are still valid
+                self._details_cache.touch(appliance_id)
+                return cached.details
+
+            details = ApplianceDetails(**response)
+            if self._details_cache is not None:
+                self._details_cache.put(appliance_id, details, response_headers.get(ETAG))
+            return details
         except aiohttp.ClientResponseError as e:
             _LOGGER.error("Error during get appliance info: %s", e)
             raise ApplianceClientException(
@@ -225,7 +401,9 @@ class ApplianceClient:
                 )
                 raise ApplianceClientException("Empty response from Electrolux API")
 
-            return ApplianceState(**response)
+            state = ApplianceState(**response)
+            self._state_store.update(state)
+            return state
         except aiohttp.ClientResponseError as e:
             _LOGGER.error("Error during get appliance state: %s", e)
             raise ApplianceClientException(
@@ -353,96 +531,140 @@ class ApplianceClient:
             raise ApplianceClientException(f"Failed to livestream config: {e}")
 
     async def start_event_stream(self,
-                                 do_on_livestream_opening_list: Optional[List[Callable[[], Awaitable[None]]]] = None):
-        """Open SSE connection and stream appliance events indefinitely."""
+                                 do_on_livestream_opening_list: Optional[List[Callable[[], Awaitable[None]]]] = None,
+                                 do_on_livestream_gap_list: Optional[List[Callable[[], Awaitable[None]]]] = None):
+        """
+        Open SSE connection and stream appliance events indefinitely.
+
+        Reconnects reuse the pooled session of the client, so the DNS cache and idle connections
+        are kept across reconnects, and are delayed according to the reconnect policy. The ID of the
+        last event received is sent as Last-Event-ID so the server can resume the stream.
+
+        Args:
+            do_on_livestream_opening_list: Callbacks awaited every time the livestream is opened.
+            do_on_livestream_gap_list: Callbacks awaited when the livestream is opened and events may
+                have been missed (see livestream_gap_possible), e.g. to poll the appliance states.
+        """
         livestream_config = await self.get_livestream_config()
         url = livestream_config.url
 
         while True:
-            websession = aiohttp.ClientSession()  # create a new session each retry
+            connected_at = None
             try:
+                websession = await self._session_manager.get_session()
                 auth_data = await self._token_manager.get_auth_data()
-                headers = {
-                    AUTHORIZATION: f"Bearer {auth_data.access_token}",
-                    API_KEY: auth_data.api_key,
-                }
+                headers = self._get_headers(auth_data)
+                last_event_id = self._last_event_id
+                if last_event_id is not None:
+                    headers = {**headers, LAST_EVENT_ID: last_event_id}
 
                 async with websession.get(
                         url,
-                        timeout=ClientTimeout(total=None, sock_connect=5, sock_read=None),
+                        timeout=ClientTimeout(total=None, sock_connect=5, sock_read=SSE_READ_TIMEOUT),
                         headers=headers,
                 ) as resp:
+                    resp.raise_for_status()
+                    connected_at = time.monotonic()
                     _LOGGER.info("Connected to SSE stream at %s", url)
+                    self._livestream_gap_possible = last_event_id is None
 
                     if do_on_livestream_opening_list:
                         _LOGGER.info("Calling do_on_livestream_opening callbacks.")
                         for callback in do_on_livestream_opening_list:
                             await callback()
 
-                    while True:
-                        data_line = None
+                    if self._livestream_gap_possible and do_on_livestream_gap_list:
+                        _LOGGER.info("Calling do_on_livestream_gap callbacks.")
+                        for callback in do_on_livestream_gap_list:
+                            await callback()
 
-                        while True:  # read one SSE event
-                            if resp.closed:
-                                _LOGGER.warning("SSE connection object closed")
-                                raise ConnectionError("SSE response stream closed unexpectedly")
+                    parser = SseParser(last_event_id)
+                    async for chunk in resp.content.iter_chunked(SSE_CHUNK_SIZE):
+                        for sse_event in parser.feed(chunk):
+                            await self._handle_sse_event(sse_event)
+                        self._last_event_id = parser.last_event_id
 
-                            line = await asyncio.wait_for(
-                                resp.content.readline(), timeout=120
-                            )
+                    _LOGGER.warning("SSE connection ended by server")
+                    raise ConnectionError("SSE connection closed by server")
 
-                            if not line:
-                                _LOGGER.warning("SSE connection ended by server")
-                                raise ConnectionError("SSE connection closed by server")
+            except aiohttp.ClientResponseError as ex:
+                _LOGGER.error("SSE error: %s - %s", ex.status, ex.message)
+            except ConnectionError as ex:
+                _LOGGER.error("SSE connection error: %s", ex)
+            except Exception as ex:
+                _LOGGER.error("Unexpected SSE error: %s", ex)
 
-                            line_str = line.decode().strip()
+            if connected_at is not None and time.monotonic() - connected_at >= self._reconnect_policy.healthy_after:
+                self._reconnect_policy.reset()
 
-                            if line_str.startswith("data:"):
-                                data_line = line_str.removeprefix("data:").strip()
-                            elif line_str == "":
-                                break
+            delay = self._reconnect_policy.next_delay()
+            _LOGGER.info("Reconnecting to SSE stream in %.1f seconds", delay)
+            await asyncio.sleep(delay)
 
-                        if not data_line:
-                            continue
+    async def _handle_sse_event(self, sse_event: SseEvent) -> None:
+        """Decode an SSE event and dispatch it to the listeners of its appliance."""
+        try:
+            event = json.loads(sse_event.data)
+        except json.JSONDecodeError:
+            _LOGGER.error("Failed to decode SSE JSON: %s", sse_event.data)
+            return
 
-                        try:
-                            event = json.loads(data_line)
-                        except json.JSONDecodeError:
-                            _LOGGER.error("Failed to decode SSE JSON: %s", data_line)
-                            continue
+        # Receiving events means the stream is healthy
+        self._reconnect_policy.reset()
 
-                        appliance_id = event.get("applianceId")
-                        if not appliance_id:
-                            continue
+        if not isinstance(event, dict):
+            return
 
-                        for callback in self._sse_listeners.get(appliance_id, []):
-                            try:
-                                callback(event)
-                            except Exception:
-                                _LOGGER.exception(
-                                    "Listener for %s failed", appliance_id
-                                )
+        appliance_id = event.get("applianceId")
+        if not appliance_id:
+            return
 
-            except aiohttp.ClientResponseError as ex:
-                _LOGGER.error("SSE error: %s - %s", ex.status, ex.message)
-                await asyncio.sleep(10)
-            except ConnectionError as ex:
-                _LOGGER.error("SSE connection error: %s", ex)
-                await asyncio.sleep(10)
-            except Exception as ex:
-                _LOGGER.error("Unexpected SSE error: %s", ex)
-                await asyncio.sleep(10)
-            finally:
-                _LOGGER.info("Close websession")
-                await websession.close()
+        if self._diff_events and (state := self._state_store.get(appliance_id)) is not None:
+            event = diff_sse_update(state, event)
+            if event is None:
+                _LOGGER.debug("Suppressed unchanged SSE update for %s", appliance_id)
+                return
+
+        self._state_store.apply_event(appliance_id, event)
+
+        if appliance_id not in self._sse_listeners:
+            return
 
-    def add_listener(self, appliance_id: str, callback: Callable[[dict[str, Any]], None]) -> None:
-        """Register a callback for a specific appliance."""
+        if self._event_coalescer is not None:
+            self._event_coalescer.add(appliance_id, event, self._dispatch_event)
+            return
+
+        await self._dispatch_event(appliance_id, event)
+
+    async def _dispatch_event(self, appliance_id: str, event: dict[str, Any]) -> None:
+        """Deliver an event, or a batch of the coalescer, to the listeners of its appliance."""
+        listeners = self._sse_listeners.get(appliance_id)
+        if not listeners:
+            return
+
+        if self._event_dispatcher is not None:
+            await self._event_dispatcher.dispatch(appliance_id, event, listeners)
+            return
+
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Listener for %s failed", appliance_id
+                )
+
+    def add_listener(self, appliance_id: str, callback: Listener) -> None:
+        """
+        Register a callback for a specific appliance.
+
+        Coroutine functions are only supported when the client has an event dispatcher.
+        """
         _LOGGER.info("Add listener for: %s", appliance_id)
 
         self._sse_listeners.setdefault(appliance_id, []).append(callback)
 
-    def remove_listener(self, appliance_id: str, callback: Callable[[dict[str, Any]], None]) -> None:
+    def remove_listener(self, appliance_id: str, callback: Listener) -> None:
         """Unregister a callback."""
         _LOGGER.info("Remove listener for: %s", appliance_id)
 
@@ -456,57 +678,43 @@ class ApplianceClient:
         _LOGGER.info("Remove all listeners for appliance %s", appliance_id)
 
         if appliance_id in self._sse_listeners:
-            self._sse_listeners.pop(appliance_id)
+            # Clear the list too, as events already queued by the dispatcher still reference it
+            self._sse_listeners.pop(appliance_id).clear()
+
+    def _get_headers(self, auth_data: AuthData) -> Mapping[str, str]:
+        """
+        Return the request headers for the given auth data.
+
+        TokenManager.update stores a new AuthData for every token generation, so the headers are
+        built once per generation and shared by the REST and SSE requests.
+        """
+        if auth_data is not self._headers_auth_data:
+            self._headers = MappingProxyType({
+                AUTHORIZATION: f"Bearer {auth_data.access_token}",
+                API_KEY: auth_data.api_key,
+                USER_AGENT: self._user_agent,
+            })
+            self._headers_auth_data = auth_data
+        return self._headers
 
     async def _send_authorized_request(
-            self, method: str, url: str, json_body: Optional[Dict[str, Any]] = None
+            self,
+            method: str,
+            url: str,
+            json_body: Optional[Dict[str, Any]] = None,
+            extra_headers: Optional[Mapping[str, str]] = None,
+            response_headers: Optional[CIMultiDict] = None,
     ):
         auth_data = await self._token_manager.get_auth_data()
-        user_agent = _build_user_agent(self._external_user_agent)
-        headers = {
-            AUTHORIZATION: f"Bearer {auth_data.access_token}",
-            API_KEY: auth_data.api_key,
-            USER_AGENT: user_agent
-        }
+        headers = self._get_headers(auth_data)
+        if extra_headers:
+            headers = {**headers, **extra_headers}
 
         return await request(
-            method=method, url=url, headers=headers, json_body=json_body
+            method=method,
+            url=url,
+            headers=headers,
+            json_body=json_body,
+            session_manager=self._session_manager,
+            response_headers=response_headers,
         )
-
-def apply_sse_update(state: ApplianceState, event: dict[str, Any]) -> ApplianceState:
-        """Apply an SSE property update into the appliance state dict and returns the updated appliance state."""
-        # Copy state into a dict
-        state_dict = state.model_dump()
-
-        prop = event.get("property")
-        value = event.get("value")
-
-        if prop is None:
-            _LOGGER.warning("Received SSE event without 'property': %s", event)
-            return state
-
-        if value is None:
-            _LOGGER.warning("Received SSE event without 'value': %s", event)
-            return state
-
-        # Special case: top-level connectionState
-        if prop == "connectionState":
-            state_dict["connectionState"] = value
-        else:
-            if prop == "connectivityState":
-                state_dict["connectionState"] = value
-
-            # Normal property update
-            reported = state_dict.setdefault("properties", {}).setdefault(
-                "reported", {}
-            )
-            path = prop.split("/")  # e.g. ["userSelections", "analogSpinSpeed"]
-
-            target = reported
-            for key in path[:-1]:
-                target = target.setdefault(key, {})
-
-            target[path[-1]] = value
-
-        # Rebuild a new ApplianceState model from updated dict
-        return ApplianceState.model_validate(state_dict)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+from .dto.appliance_state import ApplianceState
+from .sse_update import apply_sse_updates
+
+_LOGGER = logging.getLogger(__name__)
+
+StateListener = Callable[[ApplianceState], None]
+
+
+class ApplianceStateStore:
+    """
+    Latest known state of every appliance, kept up to date by the livestream.
+
+    States are seeded from the REST API and livestream events are applied to them as they arrive,
+    so reading the state of an appliance is a memory lookup. Every change increases the version of
+    the appliance by one, which allows waiting for changes newer than a version already seen.
+    Events of appliances without a known state are ignored, as a full state cannot be built from
+    them.
+    """
+
+    def __init__(self):
+        self._states: dict[str, ApplianceState] = {}
+        self._versions: dict[str, int] = {}
+        self._changed: dict[str, asyncio.Event] = {}
+        self._subscribers: dict[str, list[StateListener]] = {}
+
+    def get(self, appliance_id: str) -> Optional[ApplianceState]:
+        """Return the latest state of an appliance, or None if it is not known."""
+        return self._states.get(appliance_id)
+
+    def get_all(self) -> dict[str, ApplianceState]:
+        """Return the latest state of every known appliance."""
+        return dict(self._states)
+
+    def version(self, appliance_id: str) -> int:
+        """Return the version of the state of an appliance, 0 if it is not known."""
+        return self._versions.get(appliance_id, 0)
+
+    def update(self, state: ApplianceState) -> int:
+        """
+        Store a full appliance state, as returned by the REST API.
+
+        Returns:
+            int: The new version of the state.
+        """
+        return self._set(state.applianceId, state)
+
+    def apply_event(self, appliance_id: str, event: dict[str, Any]) -> Optional[int]:
+        """Apply a livestream property update, see apply_events."""
+        return self.apply_events(appliance_id, (event,))
+
+    def apply_events(self, appliance_id: str, events: Iterable[dict[str, Any]]) -> Optional[int]:
+        """
+        Apply livestream property updates to the state of an appliance.
+
+        Returns:
+            int, optional: The new version of the state, or None if the state of the appliance is
+                not known or was not changed.
+        """
+        state = self._states.get(appliance_id)
+        if state is None:
+            return None
+
+        updated_state = apply_sse_updates(state, events)
+        if updated_state is state:
+            return None
+        return self._set(appliance_id, updated_state)
+
+    def remove(self, appliance_id: str) -> None:
+        """Forget the state of an appliance. Its version keeps increasing if it comes back."""
+        self._states.pop(appliance_id, None)
+
+    async def wait_for_change(
+            self, appliance_id: str, since_version: int = 0, timeout: Optional[float] = None
+    ) -> tuple[int, ApplianceState]:
+        """
+        Wait until the state of an appliance is newer than a given version.
+
+        Args:
+            appliance_id: The appliance to watch.
+            since_version: Last version seen by the caller. Returns immediately when the state is
+                already newer.
+            timeout: Max seconds to wait, None to wait forever.
+
+        Returns:
+            tuple[int, ApplianceState]: The current version and state.
+
+        Raises:
+            asyncio.TimeoutError: If the state did not change within the timeout.
+        """
+        async def wait() -> None:
+            while self._versions.get(appliance_id, 0) <= since_version or appliance_id not in self._states:
+                await self._changed.setdefault(appliance_id, asyncio.Event()).wait()
+
+        await asyncio.wait_for(wait(), timeout)
+        return self._versions[appliance_id], self._states[appliance_id]
+
+    def subscribe(self, appliance_id: str, callback: StateListener) -> Callable[[], None]:
+        """
+        Register a callback called with the new state of an appliance on every change.
+
+        Returns:
+            Callable[[], None]: A function that unregisters the callback.
+        """
+        self._subscribers.setdefault(appliance_id, []).append(callback)
+
+        def unsubscribe() -> None:
+            callbacks = self._subscribers.get(appliance_id)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._subscribers[appliance_id]
+
+        return unsubscribe
+
+    def _set(self, appliance_id: str, state: ApplianceState) -> int:
+        self._states[appliance_id] = state
+        version = self._versions[appliance_id] = self._versions.get(appliance_id, 0) + 1
+
+        # Wake up the waiters; the next ones wait on a new event
+        changed = self._changed.pop(appliance_id, None)
+        if changed is not None:
+            changed.set()
+
+        for callback in list(self._subscribers.get(appliance_id, ())):
+            try:
+                callback(state)
+            except Exception:
+                _LOGGER.exception("State subscriber for %s failed", appliance_id)
+
+        return version
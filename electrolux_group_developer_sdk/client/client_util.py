@@ -1,11 +1,16 @@
 import asyncio
 import logging
 import random
-from typing import Optional, Dict, Any
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, AsyncIterator, Mapping, MutableMapping
 
 import aiohttp
+from aiohttp.hdrs import RETRY_AFTER
 
-from ..client.rate_limiter import RateLimiter
+from ..client.rate_limiter import AdaptiveRateLimiter
+from ..client.session_manager import SessionManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,34 +18,80 @@ MAX_ATTEMPTS = 3
 RETRY_STATUS_CODES = {429, 504}
 INITIAL_BACKOFF = 1
 MAX_BACKOFF = 30
+MAX_RETRY_AFTER = 60
+TOO_MANY_REQUESTS = 429
+NOT_MODIFIED = 304
 
-rate_limiter = RateLimiter(max_calls=10, period=1.0)  # 10 calls per second
+rate_limiter = AdaptiveRateLimiter(max_calls=10, period=1.0)  # 10 calls per second, slowed down on 429
 concurrency_semaphore = asyncio.Semaphore(5)  # 5 concurrent calls
 
 
+@asynccontextmanager
+async def _session_scope(session_manager: Optional[SessionManager]) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the pooled session if a manager is given, otherwise a session closed on exit."""
+    if session_manager is not None:
+        yield await session_manager.get_session()
+        return
+
+    async with aiohttp.ClientSession() as session:
+        yield session
+
+
+def _get_retry_after(headers: Any) -> Optional[float]:
+    """Return the Retry-After delay in seconds, accepting both delay-seconds and HTTP-date values."""
+    value = headers.get(RETRY_AFTER) if headers else None
+    if not value:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            _LOGGER.debug("Ignoring invalid Retry-After header: %s", value)
+            return None
+
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
 async def request(
         method: str,
         url: str,
-        headers: Optional[Dict[str, str]] = None,
-        json_body: Optional[Dict[str, Any]] = None
+        headers: Optional[Mapping[str, str]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        session_manager: Optional[SessionManager] = None,
+        response_headers: Optional[MutableMapping[str, str]] = None,
 ) -> Any:
     """
     Make an HTTP request with retry, rate limiting, and concurrency control.
 
+    A 429 response slows down the shared rate limiter and pauses every caller for the Retry-After
+    delay announced by the server. Retries wait for Retry-After when present, otherwise they use an
+    exponential backoff with jitter.
+
     Args:
         method: HTTP method (e.g., 'GET', 'POST')
         url: Full URL to call
         headers: Optional HTTP headers
         json_body: Optional JSON body for POST/PUT
+        session_manager: Optional SessionManager whose pooled session is reused. When not
+            provided, a short-lived session is opened for the call.
+        response_headers: Optional mapping filled with the headers of the final response, such as
+            a CIMultiDict for case-insensitive lookups.
+
+    Returns:
+        The decoded JSON body, or None for a 304 Not Modified response to a conditional request.
     """
     allow_retry_statuses = RETRY_STATUS_CODES
 
     for attempt in range(1, MAX_ATTEMPTS + 1):
         await rate_limiter.acquire()
+        retry_after = None
 
         try:
             async with concurrency_semaphore:
-                async with aiohttp.ClientSession() as session:
+                async with _session_scope(session_manager) as session:
                     async with session.request(
                             method=method,
                             url=url,
@@ -48,6 +99,14 @@ async def request(
                             json=json_body
                     ) as response:
 
+                        if response_headers is not None:
+                            response_headers.update(response.headers)
+
+                        if response.status == NOT_MODIFIED:
+                            _LOGGER.debug("Response from %s. status_code: %s", url, response.status)
+                            rate_limiter.on_success()
+                            return None
+
                         if response.status not in allow_retry_statuses:
                             response_body = await response.json()
                             status = response.status
@@ -60,8 +119,13 @@ async def request(
                                     headers=response.headers,
                                 )
                             _LOGGER.debug("Response from %s. status_code: %s, body: %s", url, status, response_body)
+                            rate_limiter.on_success()
                             return response_body
 
+                        retry_after = _get_retry_after(response.headers)
+                        if response.status == TOO_MANY_REQUESTS:
+                            rate_limiter.on_throttled(retry_after)
+
                         if attempt == MAX_ATTEMPTS:
                             response_text = await response.text()
                             _LOGGER.warning(f"Request failed after {MAX_ATTEMPTS} attempts. "
@@ -73,6 +137,10 @@ async def request(
                 raise e
 
         # Wait before next attempt
+        if retry_after is not None:
+            await asyncio.sleep(retry_after)
+            continue
+
         backoff = min(INITIAL_BACKOFF * 2 ** (attempt - 1), MAX_BACKOFF)
         jitter = random.uniform(0, backoff * 0.3)
         await asyncio.sleep(backoff + jitter)
@@ -0,0 +1,128 @@
+import json
+import logging
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+from urllib.parse import quote
+
+from .dto.appliance_details import ApplianceDetails
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DETAILS_TTL = 24 * 60 * 60  # seconds
+
+
+class CachedDetails(NamedTuple):
+    """Appliance details with the validator and time of their last download or revalidation."""
+
+    details: ApplianceDetails
+    etag: Optional[str]
+    fetched_at: float
+
+
+class DetailsCache:
+    """
+    Cache of appliance details, keyed by appliance ID.
+
+    Details and capabilities almost never change, so they are served from the cache for `ttl`
+    seconds. Expired entries are kept to revalidate them with a conditional request when the server
+    provided an ETag. When a directory is given, every entry is also stored there as a JSON file,
+    so the details survive restarts.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_DETAILS_TTL, path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            ttl: Seconds the cached details are used without asking the server.
+            path: Optional directory where the entries are persisted.
+        """
+        self.ttl = ttl
+        self._path = Path(path) if path is not None else None
+        self._entries: dict[str, CachedDetails] = {}
+
+        if self._path is not None:
+            self._path.mkdir(parents=True, exist_ok=True)
+
+    def get(self, appliance_id: str) -> Optional[ApplianceDetails]:
+        """Return the cached details of an appliance, or None if missing or expired."""
+        entry = self.get_entry(appliance_id)
+        if entry is None or not self.is_fresh(entry):
+            return None
+        return entry.details
+
+    def get_entry(self, appliance_id: str) -> Optional[CachedDetails]:
+        """Return the cache entry of an appliance, even if expired."""
+        entry = self._entries.get(appliance_id)
+        if entry is None and self._path is not None:
+            entry = self._load(appliance_id)
+            if entry is not None:
+                self._entries[appliance_id] = entry
+        return entry
+
+    def is_fresh(self, entry: CachedDetails) -> bool:
+        """Return True if a cache entry can be used without revalidation."""
+        return time.time() - entry.fetched_at < self.ttl
+
+    def put(self, appliance_id: str, details: ApplianceDetails, etag: Optional[str] = None) -> None:
+        """Store freshly downloaded details of an appliance."""
+        entry = CachedDetails(details=details, etag=etag, fetched_at=time.time())
+        self._entries[appliance_id] = entry
+        self._save(appliance_id, entry)
+
+    def touch(self, appliance_id: str) -> None:
+        """Mark the cached details of an appliance as revalidated by the server."""
+        entry = self.get_entry(appliance_id)
+        if entry is not None:
+            self.put(appliance_id, entry.details, entry.etag)
+
+    def invalidate(self, appliance_id: Optional[str] = None) -> None:
+        """
+        Drop the cached details of an appliance.
+
+        Args:
+            appliance_id: The appliance to drop, None to drop every appliance.
+        """
+        if appliance_id is None:
+            self._entries.clear()
+            if self._path is not None:
+                for file in self._path.glob("*.json"):
+                    file.unlink(missing_ok=True)
+            return
+
+        self._entries.pop(appliance_id, None)
+        if self._path is not None:
+            self._file(appliance_id).unlink(missing_ok=True)
+
+    def _file(self, appliance_id: str) -> Path:
+        return self._path / f"{quote(appliance_id, safe='')}.json"
+
+    def _load(self, appliance_id: str) -> Optional[CachedDetails]:
+        file = self._file(appliance_id)
+        if not file.exists():
+            return None
+
+        try:
+            with open(file) as f:
+                data = json.load(f)
+            return CachedDetails(
+                details=ApplianceDetails(**data["details"]),
+                etag=data.get("etag"),
+                fetched_at=data["fetched_at"],
+            )
+        except Exception as e:
+            _LOGGER.warning("Ignoring invalid cached details for %s: %s", appliance_id, e)
+            return None
+
+    def _save(self, appliance_id: str, entry: CachedDetails) -> None:
+        if self._path is None:
+            return
+
+        try:
+            with open(self._file(appliance_id), "w") as f:
+                json.dump({
+                    "details": entry.details.model_dump(),
+                    "etag": entry.etag,
+                    "fetched_at": entry.fetched_at,
+                }, f)
+        except OSError as e:
+            _LOGGER.warning("Failed to store cached details for %s: %s", appliance_id, e)
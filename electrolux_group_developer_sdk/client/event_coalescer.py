@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+APPLIANCE_ID = "applianceId"
+DELTA = "delta"
+
+DEFAULT_COALESCE_WINDOW = 0.5  # seconds
+
+BatchDelivery = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+class EventCoalescer:
+    """
+    Merges livestream property updates of the same appliance into batched deltas.
+
+    The first update of an appliance opens a window of `window` seconds. Updates received during the
+    window, and while the previous batch of the appliance is still being delivered, are merged into a
+    single `{"applianceId": ..., "delta": {property: value}}` event where the latest value of each
+    property wins. With a window of 0, updates are only merged while the consumer is busy.
+    """
+
+    def __init__(self, window: float = DEFAULT_COALESCE_WINDOW):
+        """
+        Args:
+            window: Seconds to wait for more updates before delivering a batch.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+
+        self.window = window
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def add(self, appliance_id: str, event: dict[str, Any], deliver: BatchDelivery) -> None:
+        """
+        Merge a property update into the pending batch of its appliance.
+
+        Args:
+            appliance_id: The appliance the update belongs to.
+            event: The decoded `{"applianceId", "property", "value"}` event.
+            deliver: Coroutine function called with the appliance ID and the batch event.
+        """
+        prop = event.get("property")
+        if prop is None:
+            _LOGGER.warning("Received SSE event without 'property': %s", event)
+            return
+
+        self._pending.setdefault(appliance_id, {})[prop] = event.get("value")
+
+        if appliance_id not in self._tasks:
+            self._tasks[appliance_id] = asyncio.create_task(self._deliver_batches(appliance_id, deliver))
+
+    async def _deliver_batches(self, appliance_id: str, deliver: BatchDelivery) -> None:
+        try:
+            while appliance_id in self._pending:
+                await asyncio.sleep(self.window)
+                delta = self._pending.pop(appliance_id)
+                try:
+                    await deliver(appliance_id, {APPLIANCE_ID: appliance_id, DELTA: delta})
+                except Exception:
+                    _LOGGER.exception("Delivering batch for %s failed", appliance_id)
+        finally:
+            self._tasks.pop(appliance_id, None)
+
+    def pending_delta(self, appliance_id: str) -> dict[str, Any]:
+        """Return a copy of the updates waiting to be delivered for an appliance."""
+        return dict(self._pending.get(appliance_id, {}))
+
+    async def join(self) -> None:
+        """Wait until every pending batch has been delivered."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel the pending deliveries and drop their updates."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
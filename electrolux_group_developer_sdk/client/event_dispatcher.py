@@ -0,0 +1,141 @@
+import asyncio
+import inspect
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+# Overflow policies
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST, COALESCE, BLOCK)
+
+DEFAULT_MAX_QUEUE_SIZE = 100
+
+Listener = Callable[[dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class EventDispatcher:
+    """
+    Asynchronous dispatcher of livestream events to listeners.
+
+    Events are put in a bounded queue per appliance and delivered by a worker task per appliance, so
+    a slow listener only delays the events of its own appliance and never the livestream read loop.
+    Listeners can be plain functions or coroutine functions. A worker only exists while its queue
+    has events.
+
+    When a queue is full, the overflow policy decides what happens to a new event:
+        - DROP_OLDEST: the oldest queued event is dropped.
+        - COALESCE: a queued event for the same property is replaced by the new one, otherwise the
+          oldest queued event is dropped.
+        - BLOCK: dispatch waits until the queue has room, applying backpressure to the livestream.
+
+    Attributes:
+        dropped_events (int): Number of events dropped because a queue was full.
+        coalesced_events (int): Number of events merged into a queued event for the same property.
+    """
+
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE, overflow_policy: str = DROP_OLDEST):
+        """
+        Args:
+            max_queue_size: Max number of queued events per appliance.
+            overflow_policy: One of DROP_OLDEST, COALESCE or BLOCK.
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow_policy must be one of {OVERFLOW_POLICIES}")
+
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.dropped_events = 0
+        self.coalesced_events = 0
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+        self._listeners: dict[str, list[Listener]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._not_full: dict[str, asyncio.Event] = {}
+
+    def queue_depth(self, appliance_id: str) -> int:
+        """Return the number of events waiting to be delivered for an appliance."""
+        queue = self._queues.get(appliance_id)
+        return len(queue) if queue else 0
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of waiting events of every appliance with a non-empty queue."""
+        return {appliance_id: len(queue) for appliance_id, queue in self._queues.items() if queue}
+
+    async def dispatch(self, appliance_id: str, event: dict[str, Any], listeners: list[Listener]) -> None:
+        """
+        Queue an event for delivery to the listeners of an appliance.
+
+        Args:
+            appliance_id: The appliance the event belongs to.
+            event: The decoded event.
+            listeners: The live list of listeners of the appliance, read again at delivery time.
+        """
+        self._listeners[appliance_id] = listeners
+        queue = self._queues.setdefault(appliance_id, deque())
+
+        if len(queue) >= self.max_queue_size:
+            if self.overflow_policy == BLOCK:
+                not_full = self._not_full.setdefault(appliance_id, asyncio.Event())
+                while len(queue) >= self.max_queue_size:
+                    not_full.clear()
+                    await not_full.wait()
+            elif self.overflow_policy == COALESCE and self._coalesce(queue, event):
+                self.coalesced_events += 1
+                return
+            else:
+                queue.popleft()
+                self.dropped_events += 1
+
+        queue.append(event)
+        if appliance_id not in self._workers:
+            self._workers[appliance_id] = asyncio.create_task(self._deliver(appliance_id))
+
+    @staticmethod
+    def _coalesce(queue: deque[dict[str, Any]], event: dict[str, Any]) -> bool:
+        prop = event.get("property")
+        if prop is None:
+            return False
+
+        for index in range(len(queue) - 1, -1, -1):
+            if queue[index].get("property") == prop:
+                queue[index] = event
+                return True
+        return False
+
+    async def _deliver(self, appliance_id: str) -> None:
+        queue = self._queues[appliance_id]
+        try:
+            while queue:
+                event = queue.popleft()
+                if (not_full := self._not_full.get(appliance_id)) is not None:
+                    not_full.set()
+
+                for callback in list(self._listeners.get(appliance_id, ())):
+                    try:
+                        result = callback(event)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception:
+                        _LOGGER.exception("Listener for %s failed", appliance_id)
+        finally:
+            self._workers.pop(appliance_id, None)
+
+    async def join(self) -> None:
+        """Wait until every queued event has been delivered."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel the workers and drop the queued events."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queues.clear()
+        self._listeners.clear()
@@ -1,11 +1,20 @@
 import asyncio
+import logging
 import time
 from collections import deque
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class RateLimiter:
     """
     Async rate limiter to allow up to `max_calls` within `period` seconds.
+
+    Each caller reserves its time slot up front and then sleeps outside of any lock, so waiters
+    do not queue behind each other. The slots of the last `max_calls` calls are kept in a
+    fixed-size ring: a new call may start once the call `max_calls` positions before it is
+    older than `period`.
     """
 
     def __init__(self, max_calls: int, period: float):
@@ -14,22 +23,127 @@ class RateLimiter:
             max_calls: Max number of allowed calls in the period.
             period: Time window in seconds.
         """
+        if max_calls < 1:
+            raise ValueError("max_calls must be at least 1")
 
         self.max_calls = max_calls
         self.period = period
-        self.calls = deque()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self):
-        """Wait until the rate limit allows a new call."""
-        async with self._lock:
-            now = time.monotonic()
-            while len(self.calls) >= self.max_calls:
-                oldest = self.calls[0]
-                if now - oldest > self.period:
-                    self.calls.popleft()
-                else:
-                    sleep_time = self.period - (now - oldest)
-                    await asyncio.sleep(sleep_time)
-                    now = time.monotonic()
-            self.calls.append(now)
+        self.calls = deque(maxlen=max_calls)
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Block every call, including already scheduled ones, for the next `seconds`."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _next_slot(self, weight: int, now: float) -> float:
+        """Return the earliest time at which `weight` calls can start."""
+        if weight < 1 or weight > self.max_calls:
+            raise ValueError(f"weight must be between 1 and {self.max_calls}")
+
+        # The call that must have left the window is the one `max_calls - weight` positions
+        # before the newest reserved slot.
+        earliest = max(now, self._paused_until)
+        index = weight - 1 - (self.max_calls - len(self.calls))
+        if index < 0:
+            return earliest
+        return max(earliest, self.calls[index] + self.period)
+
+    def _reserve(self, slot: float, weight: int) -> None:
+        for _ in range(weight):
+            self.calls.append(slot)
+
+    def try_acquire(self, weight: int = 1) -> bool:
+        """
+        Acquire `weight` calls if the rate limit allows them right now, without waiting.
+
+        Returns:
+            True if the calls were acquired, False otherwise.
+        """
+        now = time.monotonic()
+        slot = self._next_slot(weight, now)
+        if slot > now:
+            return False
+
+        self._reserve(slot, weight)
+        return True
+
+    async def acquire(self, weight: int = 1) -> None:
+        """
+        Wait until the rate limit allows `weight` new calls.
+
+        Args:
+            weight: Number of calls consumed, e.g. for a bulk request.
+        """
+        now = time.monotonic()
+        slot = self._next_slot(weight, now)
+        self._reserve(slot, weight)
+
+        # Re-check after sleeping in case a pause was announced in the meantime
+        while (delay := max(slot, self._paused_until) - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Rate limiter that slows down when the server throttles and speeds up after sustained success.
+
+    Each throttled response multiplies the period by `backoff_factor`, up to `max_period`, and pauses
+    all calls for the retry delay when the server announces one. After `recovery_threshold` consecutive successes
+    the period is divided by `recovery_factor`, back towards the configured one.
+    """
+
+    def __init__(
+            self,
+            max_calls: int,
+            period: float,
+            max_period: Optional[float] = None,
+            backoff_factor: float = 2.0,
+            recovery_factor: float = 1.25,
+            recovery_threshold: int = 20,
+    ):
+        """
+        Args:
+            max_calls: Max number of allowed calls in the period.
+            period: Time window in seconds when the server is not throttling.
+            max_period: Upper bound for the time window, defaults to 8 times `period`.
+            backoff_factor: Factor the time window grows by on each throttled response.
+            recovery_factor: Factor the time window shrinks by after sustained success.
+            recovery_threshold: Number of consecutive successes needed to shrink the time window.
+        """
+        super().__init__(max_calls, period)
+        self.base_period = period
+        self.max_period = max_period if max_period is not None else period * 8
+        self.backoff_factor = backoff_factor
+        self.recovery_factor = recovery_factor
+        self.recovery_threshold = recovery_threshold
+        self._success_count = 0
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow down after a throttled response.
+
+        Args:
+            retry_after: Seconds announced by the server before calls may resume.
+        """
+        self._success_count = 0
+        self.period = min(self.period * self.backoff_factor, self.max_period)
+        if retry_after is not None:
+            self.pause(retry_after)
+        _LOGGER.warning("Rate limited by server, allowing %s calls per %.1fs", self.max_calls, self.period)
+
+    def on_success(self) -> None:
+        """Record a successful call, speeding up again after sustained success."""
+        if self.period <= self.base_period:
+            return
+
+        self._success_count += 1
+        if self._success_count >= self.recovery_threshold:
+            self._success_count = 0
+            self.period = max(self.period / self.recovery_factor, self.base_period)
+            _LOGGER.debug("Rate limit recovering, allowing %s calls per %.1fs", self.max_calls, self.period)
+
+    def reset(self) -> None:
+        """Restore the configured period and clear any pause."""
+        self.period = self.base_period
+        self._paused_until = 0.0
+        self._success_count = 0
@@ -0,0 +1,50 @@
+import random
+
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+DEFAULT_HEALTHY_AFTER = 60.0
+
+
+class ReconnectPolicy:
+    """
+    Reconnect delays for the livestream.
+
+    The first reconnect after a healthy stream is immediate. Following ones wait an exponential
+    backoff with full jitter (a random delay between 0 and `base_delay * 2 ** n`, capped at
+    `max_delay`), so a fleet of clients does not reconnect in lockstep when the backend recovers.
+    """
+
+    def __init__(
+            self,
+            base_delay: float = DEFAULT_BASE_DELAY,
+            max_delay: float = DEFAULT_MAX_DELAY,
+            healthy_after: float = DEFAULT_HEALTHY_AFTER,
+    ):
+        """
+        Args:
+            base_delay: Backoff of the second reconnect attempt in seconds.
+            max_delay: Upper bound for the backoff in seconds.
+            healthy_after: Seconds a stream must stay connected to be considered healthy, when no
+                event was received on it.
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.healthy_after = healthy_after
+        self.consecutive_failures = 0
+        self.reconnect_count = 0
+
+    def next_delay(self) -> float:
+        """Record a reconnect and return the seconds to wait before it."""
+        attempt = self.consecutive_failures
+        self.consecutive_failures += 1
+        self.reconnect_count += 1
+
+        if attempt == 0:
+            return 0.0
+
+        backoff = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return random.uniform(0, backoff)
+
+    def reset(self) -> None:
+        """Mark the stream as healthy, so the next reconnect is immediate again."""
+        self.consecutive_failures = 0
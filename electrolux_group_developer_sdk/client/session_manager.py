@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 10
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+
+class SessionManager:
+    """
+    Long-lived owner of a pooled aiohttp ClientSession.
+
+    The session is created lazily on first use so it is bound to the running event loop, and it is
+    reused by every request so TCP connections, TLS sessions and DNS lookups are kept across calls.
+    """
+
+    def __init__(
+            self,
+            limit: int = DEFAULT_CONNECTION_LIMIT,
+            limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+            keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
+        """
+        Args:
+            limit: Max number of simultaneous connections in the pool.
+            limit_per_host: Max number of simultaneous connections to the same host.
+            ttl_dns_cache: Seconds to cache resolved DNS entries, None to cache forever.
+            keepalive_timeout: Seconds an idle connection is kept open for reuse.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        """Return True if there is no open session."""
+        return self._session is None or self._session.closed
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it if needed."""
+        if not self.closed:
+            return self._session
+
+        async with self._lock:
+            if self.closed:
+                _LOGGER.debug("Creating pooled client session")
+                self._session = aiohttp.ClientSession(connector=self._create_connector())
+            return self._session
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.ttl_dns_cache != 0,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    async def close(self) -> None:
+        """Close the shared session and release its pooled connections."""
+        session = self._session
+        self._session = None
+        if session is not None and not session.closed:
+            _LOGGER.debug("Closing pooled client session")
+            await session.close()
+
+    async def __aenter__(self) -> "SessionManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
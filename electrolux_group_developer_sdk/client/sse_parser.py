@@ -0,0 +1,111 @@
+"""Incremental parser for the Server-Sent Events wire format."""
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import NamedTuple, Optional
+
+DEFAULT_EVENT_TYPE = "message"
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class SseEvent(NamedTuple):
+    """A dispatched SSE event."""
+
+    data: str
+    event: str = DEFAULT_EVENT_TYPE
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SseParser:
+    """
+    Buffered SSE parser fed with raw bytes as they arrive from the network.
+
+    Chunks are appended to a buffer that is scanned for blank-line event boundaries, so partial
+    events are kept until the rest arrives. All the fields of the format are supported (`data`,
+    multi-line `data`, `event`, `id`, `retry` and comments) and only the data payload is decoded.
+    The parser has no I/O dependency, so it can be used and tested on its own.
+
+    Attributes:
+        last_event_id (str, optional): Last event ID received, kept across events as per the spec.
+        retry (int, optional): Last reconnection time in milliseconds requested by the server.
+    """
+
+    def __init__(self, last_event_id: Optional[str] = None):
+        self.last_event_id = last_event_id
+        self.retry: Optional[int] = None
+        self._buffer = bytearray()
+        self._skip_lf = False
+        self._started = False
+
+    def feed(self, chunk: bytes) -> list[SseEvent]:
+        """Add a chunk of bytes and return the events it completes."""
+        if self._skip_lf:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+
+        if not self._started and chunk:
+            self._started = True
+            chunk = chunk.removeprefix(_BOM)
+
+        if b"\r" in chunk:
+            # A CR at the end may be the first half of a CRLF split across chunks
+            self._skip_lf = chunk.endswith(b"\r")
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        buffer = self._buffer
+        buffer += chunk
+
+        events = []
+        start = 0
+        while (end := buffer.find(b"\n\n", start)) != -1:
+            event = self._parse_event(buffer[start:end])
+            if event is not None:
+                events.append(event)
+            start = end + 2
+
+        if start:
+            del buffer[:start]
+        return events
+
+    def _parse_event(self, block: bytes) -> Optional[SseEvent]:
+        data_lines = []
+        event_type = DEFAULT_EVENT_TYPE
+        retry = None
+
+        for line in block.split(b"\n"):
+            if not line or line[0] == 0x3A:  # empty line or ":" comment
+                continue
+
+            field, colon, value = line.partition(b":")
+            if colon and value[:1] == b" ":
+                value = value[1:]
+
+            if field == b"data":
+                data_lines.append(value)
+            elif field == b"event":
+                event_type = value.decode("utf-8", "replace")
+            elif field == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", "replace")
+            elif field == b"retry":
+                if value.isdigit():
+                    retry = self.retry = int(value)
+
+        if not data_lines:
+            return None
+
+        return SseEvent(
+            data=b"\n".join(data_lines).decode("utf-8", "replace"),
+            event=event_type or DEFAULT_EVENT_TYPE,
+            id=self.last_event_id,
+            retry=retry,
+        )
+
+
+async def iter_sse_events(chunks: AsyncIterable[bytes], parser: Optional[SseParser] = None) -> AsyncIterator[SseEvent]:
+    """Parse an async stream of byte chunks and yield its SSE events."""
+    parser = parser if parser is not None else SseParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
@@ -0,0 +1,111 @@
+"""Copy-on-write application of livestream property updates to appliance states."""
+import logging
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from .dto.appliance_state import ApplianceState
+from ..constants import REPORTED
+
+_LOGGER = logging.getLogger(__name__)
+
+OLD_VALUE = "oldValue"
+
+_MISSING = object()
+
+
+def apply_sse_update(state: ApplianceState, event: dict[str, Any]) -> ApplianceState:
+    """
+    Apply an SSE property update to an appliance state and return the updated appliance state.
+
+    The update is copy-on-write: only the dicts on the property path are copied, the rest of the
+    properties tree is shared with the given state, which is left unchanged, and the state is not
+    validated again.
+    """
+    return apply_sse_updates(state, (event,))
+
+
+def apply_sse_updates(state: ApplianceState, events: Iterable[dict[str, Any]]) -> ApplianceState:
+    """
+    Apply a batch of SSE property updates to an appliance state and return the updated appliance state.
+
+    Like apply_sse_update, but the dicts on the property paths are copied at most once per batch.
+    """
+    connection_state = state.connectionState
+    properties: Optional[dict[str, Any]] = None
+    # Dicts already copied for this batch, by id, which can be updated in place
+    copied: dict[int, dict[str, Any]] = {}
+    updated = False
+
+    for event in events:
+        prop = event.get("property")
+        value = event.get("value")
+
+        if prop is None:
+            _LOGGER.warning("Received SSE event without 'property': %s", event)
+            continue
+
+        if value is None:
+            _LOGGER.warning("Received SSE event without 'value': %s", event)
+            continue
+
+        updated = True
+
+        # Special case: top-level connectionState
+        if prop == "connectionState":
+            connection_state = value
+            continue
+
+        if prop == "connectivityState":
+            connection_state = value
+
+        # Normal property update
+        if properties is None:
+            properties = dict(state.properties)
+            copied[id(properties)] = properties
+
+        path = prop.split("/")  # e.g. ["userSelections", "analogSpinSpeed"]
+
+        target = properties
+        for key in (REPORTED, *path[:-1]):
+            child = target.get(key)
+            if id(child) not in copied:
+                child = dict(child) if isinstance(child, dict) else {}
+                copied[id(child)] = child
+                target[key] = child
+            target = child
+
+        target[path[-1]] = value
+
+    if not updated:
+        return state
+
+    update: dict[str, Any] = {"connectionState": connection_state}
+    if properties is not None:
+        update["properties"] = properties
+    return state.model_copy(update=update)
+
+
+def diff_sse_update(state: ApplianceState, event: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """
+    Compare an SSE property update with an appliance state.
+
+    Returns:
+        dict, optional: None if the update does not change the state, otherwise a copy of the event
+            with the previous value under "oldValue", left out when the property was not reported.
+    """
+    prop = event.get("property")
+    if prop is None or event.get("value") is None:
+        return event
+
+    if prop == "connectionState":
+        old_value = state.connectionState
+    else:
+        old_value = state.properties.get(REPORTED, _MISSING)
+        for key in prop.split("/"):
+            old_value = old_value.get(key, _MISSING) if isinstance(old_value, dict) else _MISSING
+
+    if old_value == event["value"]:
+        return None
+    if old_value is _MISSING:
+        return event
+    return {**event, OLD_VALUE: old_value}
@@ -1,10 +1,14 @@
+import asyncio
 import time
 
 import jwt
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
 
 from electrolux_group_developer_sdk.auth.invalid_credentials_exception import InvalidCredentialsException
+from electrolux_group_developer_sdk.auth import token_manager as token_manager_module
+from electrolux_group_developer_sdk.auth.invalid_token_exception import InvalidTokenException
 from electrolux_group_developer_sdk.auth.token_manager import TokenManager
 from electrolux_group_developer_sdk.auth.token_refresh_failed import TokenRefreshFailedException
 
@@ -44,6 +48,22 @@ class TestTokenManager():
 
         assert user_id == "test-user"
 
+    def test_update_caches_claims(self):
+        token_manager = TokenManager(ACCESS_TOKEN, "mock_refresh_token", "mock_api_key")
+        token_manager.update(NEW_ACCESS_TOKEN, "new_mock_refresh_token", "mock_api_key")
+
+        expected_claims = jwt.decode(NEW_ACCESS_TOKEN, options={"verify_signature": False})
+        assert token_manager._auth_data.exp == expected_claims["exp"]
+        assert token_manager._auth_data.sub == "test-user"
+
+    def test_get_user_id_invalid_token(self):
+        token_manager = TokenManager("not-a-jwt", "mock_refresh_token", "mock_api_key")
+
+        with pytest.raises(InvalidTokenException):
+            token_manager.get_user_id()
+
+        assert token_manager.is_token_valid() is False
+
     def test_ensure_credentials_success(self):
         token_manager = TokenManager(ACCESS_TOKEN, "mock_refresh_token", "mock_api_key")
         try:
@@ -234,3 +254,122 @@ class TestTokenManager():
 
             with pytest.raises(TokenRefreshFailedException):
                 await token_manager.get_auth_data()
+
+    @pytest.mark.asyncio
+    async def test_get_auth_data_concurrent_callers_share_refresh(self):
+        token = generate_token(-120)
+        token_manager = TokenManager(
+            access_token=token,
+            refresh_token="mock_refresh_token",
+            api_key="mock_api_key",
+        )
+
+        with aioresponses() as mocked:
+            refresh_url = "https://api.developer.electrolux.one/api/v1/token/refresh"
+
+            # Mock a single response for the token refresh
+            mocked.post(
+                refresh_url,
+                status=200,
+                payload={
+                    "accessToken": "new_access_token",
+                    "refreshToken": "new_refresh_token",
+                },
+            )
+
+            responses = await asyncio.gather(*(token_manager.get_auth_data() for _ in range(10)))
+
+            # Assertions
+            assert len(mocked.requests[("POST", URL(refresh_url))]) == 1
+            for response in responses:
+                assert response.access_token == "new_access_token"
+                assert response.refresh_token == "new_refresh_token"
+            assert token_manager._refresh_task is None
+
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_refreshes_ahead_of_expiry(self):
+        new_access_token = generate_token(3600)
+        updates = []
+
+        token_manager = TokenManager(
+            access_token=generate_token(90),
+            refresh_token="mock_refresh_token",
+            api_key="mock_api_key",
+            on_token_update=lambda *args: updates.append(args),
+        )
+
+        with aioresponses() as mocked:
+            refresh_url = "https://api.developer.electrolux.one/api/v1/token/refresh"
+            mocked.post(
+                refresh_url,
+                status=200,
+                payload={
+                    "accessToken": new_access_token,
+                    "refreshToken": "new_refresh_token",
+                },
+            )
+
+            token_manager.start_background_refresh(refresh_margin=120, jitter=0)
+            await asyncio.sleep(0.1)
+
+            # Assertions
+            assert token_manager._auth_data.access_token == new_access_token
+            assert updates[-1] == (new_access_token, "new_refresh_token", "mock_api_key")
+            assert len(mocked.requests[("POST", URL(refresh_url))]) == 1
+
+        await token_manager.close()
+        assert token_manager._background_refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_retries_with_backoff(self, monkeypatch):
+        monkeypatch.setattr(token_manager_module, "BACKGROUND_REFRESH_INITIAL_BACKOFF", 0.01)
+        new_access_token = generate_token(3600)
+
+        token_manager = TokenManager(
+            access_token=generate_token(90),
+            refresh_token="mock_refresh_token",
+            api_key="mock_api_key",
+        )
+
+        with aioresponses() as mocked:
+            refresh_url = "https://api.developer.electrolux.one/api/v1/token/refresh"
+            mocked.post(refresh_url, status=500)
+            mocked.post(
+                refresh_url,
+                status=200,
+                payload={
+                    "accessToken": new_access_token,
+                    "refreshToken": "new_refresh_token",
+                },
+            )
+
+            token_manager.start_background_refresh(refresh_margin=120, jitter=0)
+            await asyncio.sleep(0.2)
+
+            # Assertions
+            assert token_manager._auth_data.access_token == new_access_token
+            assert len(mocked.requests[("POST", URL(refresh_url))]) == 2
+
+        await token_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_waits_until_margin(self):
+        token = generate_token(3600)
+        token_manager = TokenManager(
+            access_token=token,
+            refresh_token="mock_refresh_token",
+            api_key="mock_api_key",
+        )
+
+        with aioresponses() as mocked:
+            token_manager.start_background_refresh(refresh_margin=120, jitter=0)
+            await asyncio.sleep(0.05)
+
+            # Assertions
+            assert token_manager._auth_data.access_token == token
+            assert not mocked.requests
+
+        await token_manager.stop_background_refresh()
+        await token_manager.close()
@@ -5,17 +5,24 @@ from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 from aioresponses import aioresponses
+from freezegun import freeze_time
 from yarl import URL
 
 from electrolux_group_developer_sdk.auth.auth_data import AuthData
-from electrolux_group_developer_sdk.client.appliance_client import ApplianceClient, apply_sse_update
+from electrolux_group_developer_sdk.client.appliance_client import ApplianceClient, apply_sse_update, apply_sse_updates, diff_sse_update
+from electrolux_group_developer_sdk.client import client_util
 from electrolux_group_developer_sdk.client.bad_credentials_exception import BadCredentialsException
 from electrolux_group_developer_sdk.client.client_exception import ApplianceClientException
+from electrolux_group_developer_sdk.client.details_cache import DetailsCache
 from electrolux_group_developer_sdk.client.dto.appliance import Appliance
 from electrolux_group_developer_sdk.client.dto.appliance_details import ApplianceDetails
 from electrolux_group_developer_sdk.client.dto.appliance_state import ApplianceState
 from electrolux_group_developer_sdk.client.dto.email import Email
+from electrolux_group_developer_sdk.client.event_coalescer import EventCoalescer
+from electrolux_group_developer_sdk.client.event_dispatcher import EventDispatcher
 from electrolux_group_developer_sdk.client.failed_connection_exception import FailedConnectionException
+from electrolux_group_developer_sdk.client.reconnect_policy import ReconnectPolicy
+from electrolux_group_developer_sdk.client.session_manager import SessionManager
 from electrolux_group_developer_sdk.constants import SDK_VERSION, SDK_USER_AGENT
 
 EXTERNAL_USER_AGENT = "external-user-agent"
@@ -67,6 +74,70 @@ class TestApplianceClient():
                 for res in results:
                     assert res == expected
     
+    @pytest.mark.asyncio
+    async def test_requests_reuse_shared_session(self):
+        json_path = Path(__file__).parent / "data" / "test_appliances.json"
+        with open(json_path) as f:
+            payload = json.load(f)
+
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            session_manager = SessionManager()
+
+            async with ApplianceClient(mock_token_manager, session_manager=session_manager) as appliance_client:
+                with aioresponses() as mocked:
+                    url = "https://api.developer.electrolux.one/api/v1/appliances"
+                    mocked.get(
+                        url,
+                        payload=payload,
+                        repeat=True
+                    )
+
+                    await appliance_client.get_appliances()
+                    session = await session_manager.get_session()
+                    await appliance_client.get_appliances()
+
+                    assert await session_manager.get_session() is session
+                    assert len(mocked.requests[('GET', URL(url))]) == 2
+
+            # An injected session manager is not closed by the client
+            assert not session_manager.closed
+            await session_manager.close()
+
+    def test_headers_cached_per_auth_data(self):
+        mock_token_manager = MagicMock()
+        appliance_client = ApplianceClient(mock_token_manager, EXTERNAL_USER_AGENT)
+        auth_data = AuthData(
+            access_token="mock_access_token",
+            refresh_token="mock_refresh_token",
+            api_key="mock_api_key"
+        )
+        new_auth_data = AuthData(
+            access_token="new_access_token",
+            refresh_token="new_refresh_token",
+            api_key="mock_api_key"
+        )
+
+        headers = appliance_client._get_headers(auth_data)
+
+        assert appliance_client._get_headers(auth_data) is headers
+        assert headers["Authorization"] == "Bearer mock_access_token"
+        assert headers["x-api-key"] == "mock_api_key"
+        assert headers["User-Agent"] == f"external-user-agent {SDK_USER_AGENT}/{SDK_VERSION}"
+
+        new_headers = appliance_client._get_headers(new_auth_data)
+
+        assert new_headers is not headers
+        assert new_headers["Authorization"] == "Bearer new_access_token"
+        with pytest.raises(TypeError):
+            new_headers["Authorization"] = "Bearer other"
+
     @pytest.mark.asyncio
     async def test_test_connection_success(self):
         json_path = Path(__file__).parent / "data" / "test_appliances.json"
@@ -189,6 +260,66 @@ class TestApplianceClient():
                     await appliance_client.get_user_email()
                 assert len(mocked.requests[('GET', URL(url))]) == expected_calls
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrent", [False, True])
+    async def test_get_appliance_data_success(self, concurrent):
+        appliances_payload, details_payload, state_payload = load_appliance_data_payloads()
+
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            appliance_client = ApplianceClient(mock_token_manager)
+
+            with aioresponses() as mocked:
+                mock_appliance_data_responses(mocked, appliances_payload, details_payload, state_payload)
+
+                response = await appliance_client.get_appliance_data(concurrent=concurrent, max_concurrency=2)
+
+                # Appliances are returned in order, failures of the second appliance are tolerated
+                assert [data.appliance.applianceId for data in response] == [
+                    item["applianceId"] for item in appliances_payload
+                ]
+                assert response[0].details == ApplianceDetails(**details_payload)
+                assert response[0].state == ApplianceState(**state_payload)
+                assert response[1].details is None
+                assert response[1].state is None
+
+    @pytest.mark.asyncio
+    async def test_iter_appliance_data_success(self):
+        appliances_payload, details_payload, state_payload = load_appliance_data_payloads()
+
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            appliance_client = ApplianceClient(mock_token_manager)
+
+            with aioresponses() as mocked:
+                mock_appliance_data_responses(mocked, appliances_payload, details_payload, state_payload)
+
+                response = [data async for data in appliance_client.iter_appliance_data(max_concurrency=1)]
+
+                assert sorted(data.appliance.applianceId for data in response) == sorted(
+                    item["applianceId"] for item in appliances_payload
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_appliance_data_invalid_max_concurrency(self):
+        mock_token_manager = MagicMock()
+        appliance_client = ApplianceClient(mock_token_manager)
+
+        with pytest.raises(ValueError):
+            await appliance_client.get_appliance_data(concurrent=True, max_concurrency=0)
+
     @pytest.mark.asyncio
     async def test_get_appliances_success(self):
         json_path = Path(__file__).parent / "data" / "test_appliances.json"
@@ -252,6 +383,44 @@ class TestApplianceClient():
 
                 assert len(mocked.requests[('GET', URL(url))]) == expected_calls
 
+    @pytest.mark.asyncio
+    async def test_get_appliances_honors_retry_after(self):
+        json_path = Path(__file__).parent / "data" / "test_appliances.json"
+        with open(json_path) as f:
+            payload = json.load(f)
+
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            appliance_client = ApplianceClient(mock_token_manager)
+
+            with aioresponses() as mocked:
+                url = "https://api.developer.electrolux.one/api/v1/appliances"
+                mocked.get(
+                    url,
+                    status=429,
+                    headers={"Retry-After": "0.2"}
+                )
+                mocked.get(
+                    url,
+                    payload=payload,
+                )
+
+                start = asyncio.get_event_loop().time()
+                response = await appliance_client.get_appliances()
+                duration = asyncio.get_event_loop().time() - start
+
+                assert response == [Appliance(**item) for item in payload]
+                assert len(mocked.requests[('GET', URL(url))]) == 2
+                # Waited for the announced window instead of the default backoff
+                assert 0.2 <= duration < 1.0
+                assert client_util.rate_limiter.period > client_util.rate_limiter.base_period
+
     @pytest.mark.asyncio
     async def test_get_appliance_details_success(self):
         json_path = Path(__file__).parent / "data" / "test_appliance_info.json"
@@ -284,6 +453,45 @@ class TestApplianceClient():
 
                 check_header_user_agent(mocked)
 
+    @pytest.mark.asyncio
+    async def test_get_appliance_details_with_details_cache(self):
+        json_path = Path(__file__).parent / "data" / "test_appliance_info.json"
+        with open(json_path) as f:
+            payload = json.load(f)
+
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            details_cache = DetailsCache(ttl=60)
+            appliance_id = "999011524_00:94700001-443E07021CE1"
+            url = f"https://api.developer.electrolux.one/api/v1/appliances/{appliance_id}/info"
+
+            async with ApplianceClient(mock_token_manager, details_cache=details_cache) as appliance_client:
+                with aioresponses() as mocked:
+                    mocked.get(url, payload=payload, headers={"ETag": '"v1"'})
+                    mocked.get(url, status=304)
+
+                    with freeze_time("2025-01-01 00:00:00") as frozen_time:
+                        details = await appliance_client.get_appliance_details(appliance_id)
+                        # Served from the cache
+                        assert await appliance_client.get_appliance_details(appliance_id) is details
+                        assert len(mocked.requests[("GET", URL(url))]) == 1
+
+                        # Revalidated once expired
+                        frozen_time.tick(61)
+                        assert await appliance_client.get_appliance_details(appliance_id) is details
+
+                    calls = mocked.requests[("GET", URL(url))]
+                    assert len(calls) == 2
+                    assert "If-None-Match" not in calls[0].kwargs["headers"]
+                    assert calls[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+                    assert details == ApplianceDetails(**payload)
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize("status, expected_calls", [
         (401, 1),
@@ -615,6 +823,314 @@ class TestApplianceClient():
                 with pytest.raises(Exception):
                     await appliance_client.get_memory_maps("900277470108000101100106")
 
+    @pytest.mark.asyncio
+    async def test_start_event_stream_reuses_shared_session(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            session_manager = SessionManager()
+            appliance_client = ApplianceClient(mock_token_manager, EXTERNAL_USER_AGENT, session_manager=session_manager)
+            session = await session_manager.get_session()
+
+            with aioresponses() as mocked:
+                mock_livestream(mocked, b"", repeat=True)
+
+                stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                while ('GET', URL(LIVESTREAM_URL)) not in mocked.requests:
+                    await asyncio.sleep(0.01)
+                await asyncio.sleep(0.01)
+                stream_task.cancel()
+
+                # The stream ended, but the pooled session stays open for the reconnect
+                assert await session_manager.get_session() is session
+                assert not session.closed
+                check_header_user_agent(mocked)
+
+            await session_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_reconnects_with_policy(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            reconnect_policy = ReconnectPolicy(base_delay=0.01, max_delay=0.02)
+
+            async with ApplianceClient(mock_token_manager, reconnect_policy=reconnect_policy) as appliance_client:
+                with aioresponses() as mocked:
+                    mock_livestream(mocked, b"", repeat=True)
+
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    while appliance_client.reconnect_policy.reconnect_count < 3:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+
+                    assert appliance_client.reconnect_policy.consecutive_failures >= 3
+                    assert len(mocked.requests[('GET', URL(LIVESTREAM_URL))]) >= 3
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_dispatches_events(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            events = []
+            other_events = []
+
+            async with ApplianceClient(mock_token_manager) as appliance_client:
+                appliance_client.add_listener("applianceId", events.append)
+                appliance_client.add_listener("otherApplianceId", other_events.append)
+
+                with aioresponses() as mocked:
+                    mock_livestream(
+                        mocked,
+                        b": keep-alive\n\n"
+                        b'data: {"applianceId": "applianceId", "property": "mode", "value": "OFF"}\n\n'
+                        b"data: not json\n\n"
+                        b'event: update\nid: 1\ndata: {"applianceId": "applianceId",\n'
+                        b'data: "property": "timeToEnd", "value": 10}\n\n'
+                    )
+
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    while appliance_client.reconnect_policy.reconnect_count < 1:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+
+                    assert events == [
+                        {"applianceId": "applianceId", "property": "mode", "value": "OFF"},
+                        {"applianceId": "applianceId", "property": "timeToEnd", "value": 10},
+                    ]
+                    assert other_events == []
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_resumes_with_last_event_id(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            gap_callback = AsyncMock()
+            opening_callback = AsyncMock()
+
+            async with ApplianceClient(mock_token_manager) as appliance_client:
+                with aioresponses() as mocked:
+                    mock_livestream(
+                        mocked,
+                        b'id: 41\ndata: {"applianceId": "applianceId", "property": "mode", "value": "OFF"}\n\n'
+                        b"id: 42\n\n",
+                        repeat=True
+                    )
+
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream(
+                        do_on_livestream_opening_list=[opening_callback],
+                        do_on_livestream_gap_list=[gap_callback],
+                    ))
+                    while appliance_client.reconnect_policy.reconnect_count < 2:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+
+                    calls = mocked.requests[('GET', URL(LIVESTREAM_URL))]
+                    assert "Last-Event-ID" not in calls[0].kwargs["headers"]
+                    assert calls[1].kwargs["headers"]["Last-Event-ID"] == "42"
+                    assert appliance_client.last_event_id == "42"
+                    assert appliance_client.livestream_gap_possible is False
+                    assert opening_callback.await_count >= 2
+                    # Only the first connection could have missed events
+                    assert gap_callback.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_with_event_dispatcher(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            event_dispatcher = EventDispatcher()
+            events = []
+
+            async def handle_event(event):
+                events.append(event)
+
+            async with ApplianceClient(mock_token_manager, event_dispatcher=event_dispatcher) as appliance_client:
+                appliance_client.add_listener("applianceId", handle_event)
+
+                with aioresponses() as mocked:
+                    mock_livestream(
+                        mocked,
+                        b'data: {"applianceId": "applianceId", "property": "mode", "value": "OFF"}\n\n'
+                    )
+
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    while appliance_client.reconnect_policy.reconnect_count < 1:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+                    await event_dispatcher.join()
+
+                    assert events == [{"applianceId": "applianceId", "property": "mode", "value": "OFF"}]
+
+            await event_dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_with_event_coalescer(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            event_coalescer = EventCoalescer(window=0.05)
+            events = []
+
+            async with ApplianceClient(mock_token_manager, event_coalescer=event_coalescer) as appliance_client:
+                appliance_client.add_listener("applianceId", events.append)
+
+                with aioresponses() as mocked:
+                    mock_livestream(
+                        mocked,
+                        b'data: {"applianceId": "applianceId", "property": "timeToEnd", "value": 10}\n\n'
+                        b'data: {"applianceId": "applianceId", "property": "cyclePhase", "value": "WASH"}\n\n'
+                        b'data: {"applianceId": "applianceId", "property": "timeToEnd", "value": 9}\n\n'
+                        b'data: {"applianceId": "otherApplianceId", "property": "mode", "value": "OFF"}\n\n'
+                    )
+
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    while appliance_client.reconnect_policy.reconnect_count < 1:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+                    await event_coalescer.join()
+
+                    assert events == [
+                        {"applianceId": "applianceId", "delta": {"timeToEnd": 9, "cyclePhase": "WASH"}}
+                    ]
+
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_updates_state_store(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            _, _, state_payload = load_appliance_data_payloads()
+            appliance_id = state_payload["applianceId"]
+
+            async with ApplianceClient(mock_token_manager) as appliance_client:
+                with aioresponses() as mocked:
+                    mocked.get(
+                        f"https://api.developer.electrolux.one/api/v1/appliances/{appliance_id}/state",
+                        payload=state_payload,
+                    )
+                    await appliance_client.get_appliance_state(appliance_id)
+                    assert appliance_client.state_store.version(appliance_id) == 1
+
+                    mock_livestream(
+                        mocked,
+                        f'data: {{"applianceId": "{appliance_id}", "property": "mode", "value": "COOL"}}\n\n'.encode(),
+                    )
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    version, state = await appliance_client.state_store.wait_for_change(appliance_id, 1, timeout=5)
+                    stream_task.cancel()
+
+                    assert version == 2
+                    assert state.properties["reported"]["mode"] == "COOL"
+
+
+    @pytest.mark.asyncio
+    async def test_start_event_stream_with_diff_events(self):
+        mock_token_manager = MagicMock()
+
+        with patch("electrolux_group_developer_sdk.auth.token_manager.TokenManager", return_value=mock_token_manager):
+            mock_token_manager.get_auth_data = AsyncMock(return_value=AuthData(
+                access_token="mock_access_token",
+                refresh_token="mock_refresh_token",
+                api_key="mock_api_key"
+            ))
+            _, _, state_payload = load_appliance_data_payloads()
+            appliance_id = state_payload["applianceId"]
+            events = []
+
+            async with ApplianceClient(mock_token_manager, diff_events=True) as appliance_client:
+                appliance_client.add_listener(appliance_id, events.append)
+
+                with aioresponses() as mocked:
+                    mocked.get(
+                        f"https://api.developer.electrolux.one/api/v1/appliances/{appliance_id}/state",
+                        payload=state_payload,
+                    )
+                    await appliance_client.get_appliance_state(appliance_id)
+
+                    mock_livestream(mocked, b"".join(
+                        f'data: {{"applianceId": "{appliance_id}", "property": "{prop}", "value": "{value}"}}\n\n'.encode()
+                        for prop, value in [("mode", "OFF"), ("mode", "COOL"), ("mode", "COOL"), ("newProperty", "ON")]
+                    ))
+                    stream_task = asyncio.create_task(appliance_client.start_event_stream())
+                    while appliance_client.reconnect_policy.reconnect_count < 1:
+                        await asyncio.sleep(0.01)
+                    stream_task.cancel()
+
+                    assert events == [
+                        {"applianceId": appliance_id, "property": "mode", "value": "COOL", "oldValue": "OFF"},
+                        {"applianceId": appliance_id, "property": "newProperty", "value": "ON"},
+                    ]
+
+
+LIVESTREAM_URL = "https://livestream.example.com/stream"
+
+
+def mock_livestream(mocked, body, repeat=False):
+    mocked.get(
+        "https://api.developer.electrolux.one/api/v1/configurations/livestream",
+        payload={"url": LIVESTREAM_URL, "appliances": []},
+    )
+    mocked.get(LIVESTREAM_URL, body=body, repeat=repeat)
+
+
+def load_appliance_data_payloads():
+    data_path = Path(__file__).parent / "data"
+    with open(data_path / "test_appliances.json") as f:
+        appliances_payload = json.load(f)
+    with open(data_path / "test_appliance_info.json") as f:
+        details_payload = json.load(f)
+    with open(data_path / "test_appliance_state.json") as f:
+        state_payload = json.load(f)
+    return appliances_payload, details_payload, state_payload
+
+
+def mock_appliance_data_responses(mocked, appliances_payload, details_payload, state_payload):
+    base_url = "https://api.developer.electrolux.one/api/v1/appliances"
+    working_id = appliances_payload[0]["applianceId"]
+    failing_id = appliances_payload[1]["applianceId"]
+
+    mocked.get(base_url, payload=appliances_payload)
+    mocked.get(f"{base_url}/{working_id}/info", payload=details_payload)
+    mocked.get(f"{base_url}/{working_id}/state", payload=state_payload)
+    mocked.get(f"{base_url}/{failing_id}/info", status=401)
+    mocked.get(f"{base_url}/{failing_id}/state", status=401)
+
 
 def check_header_user_agent(mocked):
     method, url_key = next(iter(mocked.requests.keys()))
@@ -658,3 +1174,76 @@ def test_apply_sse_update_connectivity_state():
     updated_state = apply_sse_update(state, state_event)
 
     assert updated_state == expected_updated_state
+
+
+def test_apply_sse_update_shares_unchanged_properties():
+    appliance_state_path = Path(__file__).parent / "data" / "test_appliance_state.json"
+
+    with open(appliance_state_path) as f:
+        state = ApplianceState(**json.load(f))
+    original = state.model_dump()
+
+    updated_state = apply_sse_update(state, {"property": "dummy/nested/ambientTemperatureC", "value": 20})
+
+    reported = state.properties["reported"]
+    updated_reported = updated_state.properties["reported"]
+    assert updated_reported["dummy"]["nested"]["ambientTemperatureC"] == 20
+    # The given state is left unchanged and only the dicts on the path are copied
+    assert state.model_dump() == original
+    assert updated_reported is not reported
+    assert updated_reported["dummy"] is not reported["dummy"]
+    for key, value in reported.items():
+        if key != "dummy" and isinstance(value, (dict, list)):
+            assert updated_reported[key] is value
+
+
+def test_apply_sse_update_without_value_returns_same_state():
+    appliance_state_path = Path(__file__).parent / "data" / "test_appliance_state.json"
+
+    with open(appliance_state_path) as f:
+        state = ApplianceState(**json.load(f))
+
+    assert apply_sse_update(state, {"property": "mode"}) is state
+
+
+def test_apply_sse_updates():
+    appliance_state_path = Path(__file__).parent / "data" / "test_appliance_state.json"
+
+    with open(appliance_state_path) as f:
+        state = ApplianceState(**json.load(f))
+    events = [
+        {"property": "fanSpeedSetting", "value": "HIGH"},
+        {"property": "dummy/nested/ambientTemperatureC", "value": 20},
+        {"property": "dummy/nested/ambientTemperatureF", "value": 68},
+        {"property": "newGroup/newProperty", "value": 1},
+        {"property": "connectivityState", "value": "disconnected"},
+    ]
+
+    updated_state = apply_sse_updates(state, events)
+
+    expected_state = state
+    for event in events:
+        expected_state = apply_sse_update(expected_state, event)
+    assert updated_state == expected_state
+    assert updated_state.connectionState == "disconnected"
+    assert state.properties["reported"]["fanSpeedSetting"] == "LOW"
+
+
+def test_diff_sse_update():
+    appliance_state_path = Path(__file__).parent / "data" / "test_appliance_state.json"
+
+    with open(appliance_state_path) as f:
+        state = ApplianceState(**json.load(f))
+
+    assert diff_sse_update(state, {"property": "fanSpeedSetting", "value": "LOW"}) is None
+    assert diff_sse_update(state, {"property": "fanSpeedSetting", "value": "HIGH"}) == {
+        "property": "fanSpeedSetting", "value": "HIGH", "oldValue": "LOW"
+    }
+    assert diff_sse_update(state, {"property": "dummy/nested/ambientTemperatureC", "value": 18}) is None
+    assert diff_sse_update(state, {"property": "dummy/nested/ambientTemperatureC", "value": 20}) == {
+        "property": "dummy/nested/ambientTemperatureC", "value": 20, "oldValue": 18
+    }
+    assert diff_sse_update(state, {"property": "connectionState", "value": "connected"}) is None
+    assert diff_sse_update(state, {"property": "mode/unknown", "value": "ON"}) == {
+        "property": "mode/unknown", "value": "ON"
+    }
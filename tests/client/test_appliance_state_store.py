@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from electrolux_group_developer_sdk.client.appliance_state_store import ApplianceStateStore
+from electrolux_group_developer_sdk.client.dto.appliance_state import ApplianceState
+
+
+def make_state(appliance_id="applianceId", mode="OFF"):
+    return ApplianceState(
+        applianceId=appliance_id,
+        connectionState="connected",
+        status="enabled",
+        properties={"reported": {"mode": mode}},
+    )
+
+
+class TestApplianceStateStore():
+
+    def test_update_and_get(self):
+        store = ApplianceStateStore()
+        state = make_state()
+
+        assert store.get("applianceId") is None
+        assert store.version("applianceId") == 0
+
+        assert store.update(state) == 1
+        assert store.get("applianceId") is state
+        assert store.get_all() == {"applianceId": state}
+
+    def test_apply_event_increases_version(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+
+        version = store.apply_event("applianceId", {"property": "mode", "value": "COOL"})
+
+        assert version == 2
+        assert store.get("applianceId").properties["reported"]["mode"] == "COOL"
+
+    def test_apply_events_as_one_change(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+
+        version = store.apply_events("applianceId", [
+            {"property": "mode", "value": "COOL"},
+            {"property": "fanSpeedSetting", "value": "HIGH"},
+        ])
+
+        assert version == 2
+        assert store.get("applianceId").properties["reported"] == {"mode": "COOL", "fanSpeedSetting": "HIGH"}
+
+    def test_apply_event_of_unknown_appliance_is_ignored(self):
+        store = ApplianceStateStore()
+
+        assert store.apply_event("applianceId", {"property": "mode", "value": "COOL"}) is None
+        assert store.get("applianceId") is None
+        assert store.version("applianceId") == 0
+
+    def test_invalid_event_does_not_change_version(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+
+        assert store.apply_event("applianceId", {"property": "mode"}) is None
+        assert store.version("applianceId") == 1
+
+    def test_remove_keeps_version_increasing(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+        store.remove("applianceId")
+
+        assert store.get("applianceId") is None
+        assert store.update(make_state()) == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+
+        waiter = asyncio.create_task(store.wait_for_change("applianceId", since_version=1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        store.apply_event("applianceId", {"property": "mode", "value": "COOL"})
+        version, state = await waiter
+
+        assert version == 2
+        assert state.properties["reported"]["mode"] == "COOL"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_returns_newer_state_immediately(self):
+        store = ApplianceStateStore()
+        store.update(make_state())
+
+        version, state = await store.wait_for_change("applianceId", since_version=0)
+
+        assert version == 1
+        assert state is store.get("applianceId")
+
+    @pytest.mark.asyncio
+    async def test_wait_for_change_timeout(self):
+        store = ApplianceStateStore()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await store.wait_for_change("applianceId", timeout=0.01)
+
+    def test_subscribe_and_unsubscribe(self):
+        store = ApplianceStateStore()
+        states = []
+        unsubscribe = store.subscribe("applianceId", states.append)
+
+        store.update(make_state())
+        store.apply_event("applianceId", {"property": "mode", "value": "COOL"})
+        unsubscribe()
+        store.apply_event("applianceId", {"property": "mode", "value": "HEAT"})
+
+        assert [state.properties["reported"]["mode"] for state in states] == ["OFF", "COOL"]
+
+    def test_failing_subscriber_does_not_stop_others(self):
+        store = ApplianceStateStore()
+        states = []
+
+        def failing_subscriber(state):
+            raise RuntimeError("subscriber failed")
+
+        store.subscribe("applianceId", failing_subscriber)
+        store.subscribe("applianceId", states.append)
+        store.update(make_state())
+
+        assert len(states) == 1
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from electrolux_group_developer_sdk.client.details_cache import DetailsCache
+from electrolux_group_developer_sdk.client.dto.appliance_details import ApplianceDetails
+
+APPLIANCE_ID = "999011524_00:94700001-443E07021CE1"
+
+
+def load_details():
+    with open(Path(__file__).parent / "data" / "test_appliance_info.json") as f:
+        return ApplianceDetails(**json.load(f))
+
+
+class TestDetailsCache():
+
+    def test_get_until_expired(self):
+        cache = DetailsCache(ttl=60)
+        details = load_details()
+
+        with freeze_time("2025-01-01 00:00:00") as frozen_time:
+            cache.put(APPLIANCE_ID, details, etag='"v1"')
+            assert cache.get(APPLIANCE_ID) is details
+
+            frozen_time.tick(61)
+            assert cache.get(APPLIANCE_ID) is None
+            # Expired entries are kept for revalidation
+            assert cache.get_entry(APPLIANCE_ID).etag == '"v1"'
+
+            cache.touch(APPLIANCE_ID)
+            assert cache.get(APPLIANCE_ID) is details
+
+    def test_invalidate(self):
+        cache = DetailsCache()
+        details = load_details()
+        cache.put(APPLIANCE_ID, details)
+        cache.put("otherApplianceId", details)
+
+        cache.invalidate(APPLIANCE_ID)
+        assert cache.get_entry(APPLIANCE_ID) is None
+        assert cache.get("otherApplianceId") is details
+
+        cache.invalidate()
+        assert cache.get_entry("otherApplianceId") is None
+
+    def test_persisted_entries_survive_restarts(self, tmp_path):
+        details = load_details()
+        DetailsCache(path=tmp_path).put(APPLIANCE_ID, details, etag='"v1"')
+
+        entry = DetailsCache(path=tmp_path).get_entry(APPLIANCE_ID)
+
+        assert entry.details == details
+        assert entry.etag == '"v1"'
+
+    def test_invalidate_removes_persisted_entries(self, tmp_path):
+        cache = DetailsCache(path=tmp_path)
+        cache.put(APPLIANCE_ID, load_details())
+
+        cache.invalidate(APPLIANCE_ID)
+
+        assert DetailsCache(path=tmp_path).get_entry(APPLIANCE_ID) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_persisted_entry_is_ignored(self, tmp_path):
+        cache = DetailsCache(path=tmp_path)
+        cache.put(APPLIANCE_ID, load_details())
+        for file in tmp_path.iterdir():
+            file.write_text("not json")
+
+        assert DetailsCache(path=tmp_path).get_entry(APPLIANCE_ID) is None
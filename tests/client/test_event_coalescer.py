@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from electrolux_group_developer_sdk.client.event_coalescer import EventCoalescer
+
+
+def make_event(prop, value, appliance_id="applianceId"):
+    return {"applianceId": appliance_id, "property": prop, "value": value}
+
+
+class TestEventCoalescer():
+
+    @pytest.mark.asyncio
+    async def test_updates_within_window_are_merged(self):
+        coalescer = EventCoalescer(window=0.05)
+        batches = []
+
+        async def deliver(appliance_id, batch):
+            batches.append(batch)
+
+        coalescer.add("applianceId", make_event("cyclePhase", "WASH"), deliver)
+        coalescer.add("applianceId", make_event("timeToEnd", 10), deliver)
+        coalescer.add("applianceId", make_event("timeToEnd", 9), deliver)
+        assert coalescer.pending_delta("applianceId") == {"cyclePhase": "WASH", "timeToEnd": 9}
+        await coalescer.join()
+
+        assert batches == [{"applianceId": "applianceId", "delta": {"cyclePhase": "WASH", "timeToEnd": 9}}]
+
+    @pytest.mark.asyncio
+    async def test_appliances_are_batched_separately(self):
+        coalescer = EventCoalescer(window=0)
+        batches = []
+
+        async def deliver(appliance_id, batch):
+            batches.append((appliance_id, batch["delta"]))
+
+        coalescer.add("first", make_event("mode", "OFF", "first"), deliver)
+        coalescer.add("second", make_event("mode", "ON", "second"), deliver)
+        await coalescer.join()
+
+        assert sorted(batches) == [("first", {"mode": "OFF"}), ("second", {"mode": "ON"})]
+
+    @pytest.mark.asyncio
+    async def test_updates_are_merged_while_consumer_is_busy(self):
+        coalescer = EventCoalescer(window=0)
+        release = asyncio.Event()
+        batches = []
+
+        async def deliver(appliance_id, batch):
+            batches.append(batch["delta"])
+            await release.wait()
+
+        coalescer.add("applianceId", make_event("timeToEnd", 10), deliver)
+        while not batches:
+            await asyncio.sleep(0)
+
+        coalescer.add("applianceId", make_event("timeToEnd", 9), deliver)
+        coalescer.add("applianceId", make_event("timeToEnd", 8), deliver)
+        release.set()
+        await coalescer.join()
+
+        assert batches == [{"timeToEnd": 10}, {"timeToEnd": 8}]
+
+    @pytest.mark.asyncio
+    async def test_failing_delivery_does_not_stop_batches(self):
+        coalescer = EventCoalescer(window=0)
+        batches = []
+
+        async def deliver(appliance_id, batch):
+            batches.append(batch["delta"])
+            raise RuntimeError("listener failed")
+
+        coalescer.add("applianceId", make_event("mode", "OFF"), deliver)
+        await coalescer.join()
+        coalescer.add("applianceId", make_event("mode", "ON"), deliver)
+        await coalescer.join()
+
+        assert batches == [{"mode": "OFF"}, {"mode": "ON"}]
+
+    @pytest.mark.asyncio
+    async def test_event_without_property_is_ignored(self):
+        coalescer = EventCoalescer(window=0)
+
+        async def deliver(appliance_id, batch):
+            pass
+
+        coalescer.add("applianceId", {"applianceId": "applianceId", "value": "OFF"}, deliver)
+
+        assert coalescer.pending_delta("applianceId") == {}
+        await coalescer.join()
+
+    @pytest.mark.asyncio
+    async def test_close_drops_pending_updates(self):
+        coalescer = EventCoalescer(window=10)
+        batches = []
+
+        async def deliver(appliance_id, batch):
+            batches.append(batch)
+
+        coalescer.add("applianceId", make_event("mode", "OFF"), deliver)
+        await coalescer.close()
+
+        assert batches == []
+        assert coalescer.pending_delta("applianceId") == {}
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            EventCoalescer(window=-1)
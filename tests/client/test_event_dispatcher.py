@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from electrolux_group_developer_sdk.client.event_dispatcher import EventDispatcher, DROP_OLDEST, COALESCE, BLOCK
+
+
+def make_event(prop, value, appliance_id="applianceId"):
+    return {"applianceId": appliance_id, "property": prop, "value": value}
+
+
+class TestEventDispatcher():
+
+    @pytest.mark.asyncio
+    async def test_dispatch_sync_and_async_listeners(self):
+        dispatcher = EventDispatcher()
+        received = []
+
+        async def async_listener(event):
+            await asyncio.sleep(0)
+            received.append(("async", event["value"]))
+
+        listeners = [lambda event: received.append(("sync", event["value"])), async_listener]
+
+        await dispatcher.dispatch("applianceId", make_event("mode", "OFF"), listeners)
+        await dispatcher.dispatch("applianceId", make_event("mode", "ON"), listeners)
+        await dispatcher.join()
+
+        assert received == [("sync", "OFF"), ("async", "OFF"), ("sync", "ON"), ("async", "ON")]
+
+    @pytest.mark.asyncio
+    async def test_slow_listener_does_not_block_other_appliances(self):
+        dispatcher = EventDispatcher()
+        release = asyncio.Event()
+        received = []
+
+        async def slow_listener(event):
+            await release.wait()
+
+        await dispatcher.dispatch("slow", make_event("mode", "OFF", "slow"), [slow_listener])
+        await dispatcher.dispatch("fast", make_event("mode", "OFF", "fast"), [received.append])
+        await asyncio.sleep(0.01)
+
+        assert received == [make_event("mode", "OFF", "fast")]
+
+        release.set()
+        await dispatcher.join()
+
+    @pytest.mark.asyncio
+    async def test_listener_exception_does_not_stop_delivery(self):
+        dispatcher = EventDispatcher()
+        received = []
+
+        def failing_listener(event):
+            raise RuntimeError("failure")
+
+        listeners = [failing_listener, received.append]
+        await dispatcher.dispatch("applianceId", make_event("mode", "OFF"), listeners)
+        await dispatcher.dispatch("applianceId", make_event("mode", "ON"), listeners)
+        await dispatcher.join()
+
+        assert [event["value"] for event in received] == ["OFF", "ON"]
+
+    @pytest.mark.asyncio
+    async def test_overflow_drop_oldest(self):
+        dispatcher = EventDispatcher(max_queue_size=2, overflow_policy=DROP_OLDEST)
+        received = []
+
+        for value in range(4):
+            await dispatcher.dispatch("applianceId", make_event("timeToEnd", value), [received.append])
+
+        assert dispatcher.queue_depths() == {"applianceId": 2}
+        await dispatcher.join()
+
+        assert [event["value"] for event in received] == [2, 3]
+        assert dispatcher.dropped_events == 2
+        assert dispatcher.queue_depth("applianceId") == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_coalesce(self):
+        dispatcher = EventDispatcher(max_queue_size=2, overflow_policy=COALESCE)
+        received = []
+
+        await dispatcher.dispatch("applianceId", make_event("timeToEnd", 1), [received.append])
+        await dispatcher.dispatch("applianceId", make_event("cyclePhase", "WASH"), [received.append])
+        await dispatcher.dispatch("applianceId", make_event("timeToEnd", 2), [received.append])
+        await dispatcher.dispatch("applianceId", make_event("doorState", "CLOSED"), [received.append])
+        await dispatcher.join()
+
+        # timeToEnd 2 replaced the queued timeToEnd 1, doorState had no match and dropped the oldest
+        assert [(event["property"], event["value"]) for event in received] == [
+            ("cyclePhase", "WASH"),
+            ("doorState", "CLOSED"),
+        ]
+        assert dispatcher.coalesced_events == 1
+        assert dispatcher.dropped_events == 1
+
+    @pytest.mark.asyncio
+    async def test_overflow_block(self):
+        dispatcher = EventDispatcher(max_queue_size=1, overflow_policy=BLOCK)
+        received = []
+
+        await dispatcher.dispatch("applianceId", make_event("timeToEnd", 1), [received.append])
+        blocked = asyncio.create_task(
+            dispatcher.dispatch("applianceId", make_event("timeToEnd", 2), [received.append])
+        )
+        await dispatcher.dispatch("applianceId", make_event("timeToEnd", 3), [received.append])
+        await blocked
+        await dispatcher.join()
+
+        assert sorted(event["value"] for event in received) == [1, 2, 3]
+        assert dispatcher.dropped_events == 0
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError):
+            EventDispatcher(overflow_policy="unknown")
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_workers(self):
+        dispatcher = EventDispatcher()
+        never = asyncio.Event()
+
+        async def blocked_listener(event):
+            await never.wait()
+
+        await dispatcher.dispatch("applianceId", make_event("mode", "OFF"), [blocked_listener])
+        await dispatcher.dispatch("applianceId", make_event("mode", "ON"), [blocked_listener])
+        await dispatcher.close()
+
+        assert dispatcher.queue_depths() == {}
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from electrolux_group_developer_sdk.client.rate_limiter import RateLimiter, AdaptiveRateLimiter
+
+
+class TestRateLimiter():
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_limit_does_not_wait(self):
+        rate_limiter = RateLimiter(max_calls=5, period=1.0)
+
+        start = asyncio.get_event_loop().time()
+        for _ in range(5):
+            await rate_limiter.acquire()
+        duration = asyncio.get_event_loop().time() - start
+
+        assert duration < 0.1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_next_window(self):
+        rate_limiter = RateLimiter(max_calls=2, period=0.2)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*(rate_limiter.acquire() for _ in range(5)))
+        duration = asyncio.get_event_loop().time() - start
+
+        # Slots at 0, 0, 0.2, 0.2, 0.4
+        assert 0.4 <= duration < 0.6
+
+    @pytest.mark.asyncio
+    async def test_waiters_sleep_concurrently(self):
+        rate_limiter = RateLimiter(max_calls=1, period=0.1)
+        finished = []
+
+        async def call(i):
+            await rate_limiter.acquire()
+            finished.append(i)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*(call(i) for i in range(4)))
+        duration = asyncio.get_event_loop().time() - start
+
+        assert finished == [0, 1, 2, 3]
+        assert 0.3 <= duration < 0.5
+
+    def test_try_acquire(self):
+        rate_limiter = RateLimiter(max_calls=2, period=10.0)
+
+        assert rate_limiter.try_acquire() is True
+        assert rate_limiter.try_acquire() is True
+        assert rate_limiter.try_acquire() is False
+
+    def test_try_acquire_weighted(self):
+        rate_limiter = RateLimiter(max_calls=5, period=10.0)
+
+        assert rate_limiter.try_acquire(weight=3) is True
+        assert rate_limiter.try_acquire(weight=3) is False
+        assert rate_limiter.try_acquire(weight=2) is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_weighted_waits(self):
+        rate_limiter = RateLimiter(max_calls=4, period=0.2)
+
+        start = asyncio.get_event_loop().time()
+        await rate_limiter.acquire(weight=3)
+        await rate_limiter.acquire(weight=3)
+        duration = asyncio.get_event_loop().time() - start
+
+        assert 0.2 <= duration < 0.3
+
+    @pytest.mark.parametrize("weight", [0, 3])
+    def test_invalid_weight(self, weight):
+        rate_limiter = RateLimiter(max_calls=2, period=1.0)
+
+        with pytest.raises(ValueError):
+            rate_limiter.try_acquire(weight=weight)
+
+    @pytest.mark.asyncio
+    async def test_pause_delays_scheduled_waiters(self):
+        rate_limiter = RateLimiter(max_calls=1, period=0.1)
+        await rate_limiter.acquire()
+
+        start = asyncio.get_event_loop().time()
+        waiter = asyncio.create_task(rate_limiter.acquire())
+        await asyncio.sleep(0)
+        rate_limiter.pause(0.3)
+        await waiter
+        duration = asyncio.get_event_loop().time() - start
+
+        assert duration >= 0.3
+
+
+class TestAdaptiveRateLimiter():
+
+    def test_on_throttled_slows_down(self):
+        rate_limiter = AdaptiveRateLimiter(max_calls=10, period=1.0, max_period=3.0)
+
+        rate_limiter.on_throttled()
+        assert rate_limiter.period == 2.0
+
+        rate_limiter.on_throttled()
+        assert rate_limiter.period == 3.0
+
+    def test_on_throttled_with_retry_after_pauses(self):
+        rate_limiter = AdaptiveRateLimiter(max_calls=10, period=1.0)
+
+        rate_limiter.on_throttled(retry_after=10)
+
+        assert rate_limiter.try_acquire() is False
+
+    def test_on_success_recovers_after_threshold(self):
+        rate_limiter = AdaptiveRateLimiter(
+            max_calls=10, period=1.0, recovery_factor=2.0, recovery_threshold=3
+        )
+        rate_limiter.on_throttled()
+        rate_limiter.on_throttled()
+        assert rate_limiter.period == 4.0
+
+        for _ in range(2):
+            rate_limiter.on_success()
+        assert rate_limiter.period == 4.0
+
+        rate_limiter.on_success()
+        assert rate_limiter.period == 2.0
+
+        for _ in range(6):
+            rate_limiter.on_success()
+        assert rate_limiter.period == 1.0
+
+    def test_reset(self):
+        rate_limiter = AdaptiveRateLimiter(max_calls=10, period=1.0)
+        rate_limiter.on_throttled(retry_after=10)
+
+        rate_limiter.reset()
+
+        assert rate_limiter.period == 1.0
+        assert rate_limiter.try_acquire() is True
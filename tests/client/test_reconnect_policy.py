@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from electrolux_group_developer_sdk.client.reconnect_policy import ReconnectPolicy
+
+
+class TestReconnectPolicy():
+
+    def test_first_reconnect_is_immediate(self):
+        policy = ReconnectPolicy()
+
+        assert policy.next_delay() == 0.0
+        assert policy.reconnect_count == 1
+        assert policy.consecutive_failures == 1
+
+    def test_next_delay_backs_off_with_full_jitter(self):
+        policy = ReconnectPolicy(base_delay=1.0, max_delay=5.0)
+        policy.next_delay()
+
+        with patch("electrolux_group_developer_sdk.client.reconnect_policy.random.uniform",
+                   side_effect=lambda low, high: high) as uniform:
+            delays = [policy.next_delay() for _ in range(5)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+        assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+    def test_reset(self):
+        policy = ReconnectPolicy()
+        for _ in range(3):
+            policy.next_delay()
+
+        policy.reset()
+
+        assert policy.next_delay() == 0.0
+        assert policy.reconnect_count == 4
@@ -0,0 +1,47 @@
+import pytest
+
+from electrolux_group_developer_sdk.client.session_manager import SessionManager
+
+
+class TestSessionManager():
+
+    @pytest.mark.asyncio
+    async def test_get_session_reuses_session(self):
+        session_manager = SessionManager(limit_per_host=4, ttl_dns_cache=60)
+
+        session = await session_manager.get_session()
+
+        assert await session_manager.get_session() is session
+        assert session.connector.limit_per_host == 4
+
+        await session_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        session_manager = SessionManager()
+        session = await session_manager.get_session()
+
+        await session_manager.close()
+
+        assert session.closed
+        assert session_manager.closed
+
+    @pytest.mark.asyncio
+    async def test_get_session_after_close_creates_new_session(self):
+        session_manager = SessionManager()
+        session = await session_manager.get_session()
+        await session_manager.close()
+
+        new_session = await session_manager.get_session()
+
+        assert new_session is not session
+        assert not new_session.closed
+
+        await session_manager.close()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_session(self):
+        async with SessionManager() as session_manager:
+            session = await session_manager.get_session()
+
+        assert session.closed
@@ -0,0 +1,88 @@
+import pytest
+
+from electrolux_group_developer_sdk.client.sse_parser import SseEvent, SseParser, iter_sse_events
+
+
+class TestSseParser():
+
+    def test_feed_single_event(self):
+        parser = SseParser()
+
+        events = parser.feed(b'data: {"property": "mode"}\n\n')
+
+        assert events == [SseEvent(data='{"property": "mode"}')]
+
+    def test_feed_event_split_across_chunks(self):
+        parser = SseParser()
+
+        assert parser.feed(b"da") == []
+        assert parser.feed(b"ta: hel") == []
+        assert parser.feed(b"lo\n") == []
+        assert parser.feed(b"\ndata: world\n\n") == [SseEvent(data="hello"), SseEvent(data="world")]
+
+    def test_feed_all_fields(self):
+        parser = SseParser()
+
+        events = parser.feed(
+            b": comment\n"
+            b"event: update\n"
+            b"id: 42\n"
+            b"retry: 3000\n"
+            b"data: first\n"
+            b"data: second\n"
+            b"\n"
+        )
+
+        assert events == [SseEvent(data="first\nsecond", event="update", id="42", retry=3000)]
+        assert parser.last_event_id == "42"
+        assert parser.retry == 3000
+
+    def test_feed_id_kept_across_events(self):
+        parser = SseParser(last_event_id="1")
+
+        events = parser.feed(b"data: a\n\nid: 2\ndata: b\n\ndata: c\n\n")
+
+        assert [event.id for event in events] == ["1", "2", "2"]
+
+    def test_feed_id_without_data_is_not_dispatched(self):
+        parser = SseParser()
+
+        assert parser.feed(b"id: 7\n\n") == []
+        assert parser.last_event_id == "7"
+
+    @pytest.mark.parametrize("chunks", [
+        [b"data: a\r\n\r\ndata: b\r\n\r\n"],
+        [b"data: a\r", b"\n\r", b"\ndata: b\r\n\r\n"],
+        [b"data: a\r\rdata: b\r", b"\r"],
+    ])
+    def test_feed_line_endings(self, chunks):
+        parser = SseParser()
+
+        events = [event for chunk in chunks for event in parser.feed(chunk)]
+
+        assert events == [SseEvent(data="a"), SseEvent(data="b")]
+
+    def test_feed_field_without_space_and_bom(self):
+        parser = SseParser()
+
+        events = parser.feed(b"\xef\xbb\xbfdata:value\nunknown: field\ndata\n\n")
+
+        assert events == [SseEvent(data="value\n")]
+
+    def test_feed_invalid_retry_ignored(self):
+        parser = SseParser()
+
+        events = parser.feed(b"retry: soon\ndata: a\n\n")
+
+        assert events == [SseEvent(data="a")]
+        assert parser.retry is None
+
+    @pytest.mark.asyncio
+    async def test_iter_sse_events(self):
+        async def chunks():
+            for chunk in [b"data: a\n", b"\ndata: b\n\n"]:
+                yield chunk
+
+        events = [event async for event in iter_sse_events(chunks())]
+
+        assert events == [SseEvent(data="a"), SseEvent(data="b")]
@@ -0,0 +1,11 @@
+import pytest
+
+from electrolux_group_developer_sdk.client import client_util
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Keep the adaptive slow down of the shared rate limiter from leaking between tests."""
+    client_util.rate_limiter.reset()
+    yield
+    client_util.rate_limiter.reset()